@@ -0,0 +1,137 @@
+"""
+Model preload daemon for benchmarks.
+
+Keeps STT and TTS loaded in one long-lived process so repeated benchmark
+runs skip the multi-second CUDA context setup and weight load. Benchmarks
+call connect() and fall back to loading in-process when no daemon is running.
+
+The manager protocol is pickle-based, so the daemon is only reachable with
+a random authkey generated at each start. It is written, with the port,
+to a file only the current user can read (~/.jett/model_daemon.json); the
+handshake is mutual, so clients also refuse a squatter on the port.
+
+Usage:
+    python benchmarks/_model_daemon.py    # Start daemon (Ctrl+C to stop)
+"""
+
+import json
+import os
+import secrets
+import sys
+import time
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+from typing import Optional
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
+
+HOST = "127.0.0.1"
+# Port and authkey of the running daemon; removed when it stops
+CONNECTION_FILE = Path.home() / ".jett" / "model_daemon.json"
+
+
+class _Models:
+    """Loaded STT + TTS models, served to benchmark clients by proxy."""
+
+    def __init__(self):
+        self.stt = None
+        self.tts = None
+
+    def load(self) -> float:
+        """Load any models not yet resident. Returns load time in seconds."""
+        start = time.perf_counter()
+
+        if self.stt is None:
+            from src.voice.stt import STT
+            # Same STT configuration the voice pipeline loads by default
+            self.stt = STT(device="cuda")
+            self.stt.load()
+
+        if self.tts is None:
+            from src.voice.tts import TTS
+            self.tts = TTS(voice="af_heart", device="cuda")
+            self.tts.load()
+
+        return time.perf_counter() - start
+
+    def synthesize(self, text: str):
+        return self.tts.synthesize(text)
+
+    def synthesize_timed(self, text: str):
+        return self.tts.synthesize_timed(text)
+
+    def synthesize_batch_timed(self, texts: list[str]):
+        return self.tts.synthesize_batch_timed(texts)
+
+    def synthesize_to_file(self, text: str, path: str) -> float:
+        return self.tts.synthesize_to_file(text, path)
+
+    def transcribe(self, audio_path: str):
+        return self.stt.transcribe(audio_path)
+
+
+class ModelManager(BaseManager):
+    pass
+
+
+def connect() -> Optional[object]:
+    """
+    Connect to a running daemon.
+
+    Returns:
+        Proxy exposing load(), synthesize(), synthesize_timed(),
+        synthesize_to_file() and transcribe(), or None if no daemon is up.
+    """
+    try:
+        info = json.loads(CONNECTION_FILE.read_text())
+        address = (HOST, int(info["port"]))
+        authkey = bytes.fromhex(info["authkey"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # No daemon has been started (or the file is unreadable)
+
+    ModelManager.register("models")
+    manager = ModelManager(address=address, authkey=authkey)
+    try:
+        manager.connect()
+    except (ConnectionRefusedError, OSError):
+        return None
+    return manager.models()
+
+
+def _write_connection_file(port: int, authkey: bytes) -> None:
+    """Record port and authkey in a file readable by the current user only."""
+    CONNECTION_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    CONNECTION_FILE.unlink(missing_ok=True)  # O_CREAT mode only applies to new files
+    fd = os.open(CONNECTION_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"port": port, "authkey": authkey.hex()}, f)
+
+
+def main():
+    models = _Models()
+    print("Loading models...")
+    load_time = models.load()
+    print(f"Models loaded in {load_time:.1f}s")
+
+    # Fresh key per start; port 0 lets the OS pick a free port
+    authkey = secrets.token_bytes(32)
+    ModelManager.register("models", callable=lambda: models)
+    manager = ModelManager(address=(HOST, 0), authkey=authkey)
+    server = manager.get_server()
+    port = server.address[1]
+    _write_connection_file(port, authkey)
+
+    print(f"Model daemon listening on {HOST}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping model daemon.")
+    finally:
+        CONNECTION_FILE.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    main()
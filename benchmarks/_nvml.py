@@ -0,0 +1,96 @@
+"""
+Shared VRAM query helper for benchmarks.
+
+Uses NVML (pynvml) so each poll is a C-API call (microseconds) instead of
+forking nvidia-smi and parsing its CSV output (tens of milliseconds).
+
+Without pynvml (or when NVML can't initialise), a single long-running
+`nvidia-smi --loop-ms` child is started on first use and each poll waits
+for its next sample, so repeated polls don't fork a new process each
+time.
+"""
+
+import atexit
+import subprocess
+import threading
+
+try:
+    import pynvml
+except ImportError:
+    pynvml = None
+
+_HANDLE = None
+if pynvml is not None:
+    try:
+        pynvml.nvmlInit()
+        atexit.register(pynvml.nvmlShutdown)
+        _HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+    except pynvml.NVMLError:
+        # Installed but no usable driver/GPU behind it: use nvidia-smi
+        _HANDLE = None
+
+# Sampling period for the nvidia-smi fallback
+LOOP_MS = 200
+
+# How long get_vram_mb() waits for a fresh nvidia-smi sample (the first
+# one includes nvidia-smi's own startup)
+SAMPLE_TIMEOUT = 5.0
+
+_proc = None
+_latest_mb = None
+_sample_seq = 0  # Bumped per sample, so callers can wait for a newer one
+_sample_cond = threading.Condition()
+
+
+def _read_samples(proc: subprocess.Popen) -> None:
+    """Reader thread: keep only the most recent sample from nvidia-smi."""
+    global _latest_mb, _sample_seq
+    for line in proc.stdout:
+        line = line.strip()
+        if line.isdigit():
+            with _sample_cond:
+                _latest_mb = int(line)
+                _sample_seq += 1
+                _sample_cond.notify_all()
+
+
+def _start_sampler() -> None:
+    """Start the shared nvidia-smi --loop-ms child (once)."""
+    global _proc
+    _proc = subprocess.Popen(
+        [
+            "nvidia-smi",
+            "--query-gpu=memory.used",
+            "--format=csv,noheader,nounits",
+            f"--loop-ms={LOOP_MS}",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    atexit.register(_proc.kill)
+    threading.Thread(target=_read_samples, args=(_proc,), daemon=True).start()
+
+
+def get_vram_mb() -> int:
+    """
+    Get current VRAM usage in MB.
+
+    With the nvidia-smi fallback this blocks (up to one LOOP_MS period) for
+    a sample printed after the call, so a reading taken right after loading
+    a model never reports the usage from before it.
+
+    Raises:
+        RuntimeError: If nvidia-smi produces no new sample within
+            SAMPLE_TIMEOUT seconds.
+    """
+    if _HANDLE is not None:
+        return pynvml.nvmlDeviceGetMemoryInfo(_HANDLE).used >> 20
+
+    with _sample_cond:
+        if _proc is None:
+            _start_sampler()
+        seq = _sample_seq
+        if not _sample_cond.wait_for(lambda: _sample_seq > seq, timeout=SAMPLE_TIMEOUT):
+            raise RuntimeError("nvidia-smi produced no new VRAM sample")
+        return _latest_mb
@@ -15,8 +15,8 @@ Requirements:
 """
 
 import argparse
+import json
 import os
-import statistics
 import sys
 import time
 from dataclasses import dataclass, field
@@ -33,38 +33,56 @@ os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
 @dataclass
 class BenchmarkResults:
-    """Aggregated benchmark results."""
-    stt_times: list[float] = field(default_factory=list)
-    llm_first_times: list[float] = field(default_factory=list)
-    tts_first_times: list[float] = field(default_factory=list)
-    e2e_times: list[float] = field(default_factory=list)
+    """Aggregated benchmark results (integer-ms timings in preallocated per-run arrays)."""
+    stt_times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    llm_first_times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    tts_first_times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    e2e_times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
     transcriptions: list[str] = field(default_factory=list)
     responses: list[str] = field(default_factory=list)
 
 
-def percentile(data: list[float], p: int) -> float:
-    """Calculate percentile of a list."""
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    k = (len(sorted_data) - 1) * p / 100
-    f = int(k)
-    c = f + 1 if f + 1 < len(sorted_data) else f
-    return sorted_data[f] + (sorted_data[c] - sorted_data[f]) * (k - f)
+def _percentiles(arr: np.ndarray, ps: tuple[float, ...]) -> list[float]:
+    """
+    Linearly interpolated percentiles (same result as np.percentile).
+
+    Short series use np.partition on just the two ranks around each
+    percentile, which is O(N) instead of a full sort.
+    """
+    if arr.size >= 64:
+        return list(np.percentile(arr, ps))
+
+    positions = [(arr.size - 1) * p / 100 for p in ps]
+    lows = [int(pos) for pos in positions]
+    highs = [min(lo + 1, arr.size - 1) for lo in lows]
+    part = np.partition(arr, sorted(set(lows + highs)))
+    return [
+        float(part[lo] + (pos - lo) * (float(part[hi]) - part[lo]))
+        for pos, lo, hi in zip(positions, lows, highs)
+    ]
+
 
+def _stats(arr: np.ndarray) -> tuple[float, float, float, float, float]:
+    """Return (P50, P95, min, max, mean) for a non-empty series in one call."""
+    p50, p95 = _percentiles(arr, (50, 95))
+    return p50, p95, arr.min(), arr.max(), arr.mean()
 
-def format_stats(times: list[float], label: str) -> str:
-    """Format statistics for a list of times."""
-    if not times:
+
+def format_stats(times, label: str) -> str:
+    """Format statistics for a series of times."""
+    arr = np.asarray(times)
+    if arr.size == 0:
         return f"{label}: No data"
 
+    p50, p95, mn, mx, avg = _stats(arr)
+
     return (
         f"{label:<15} "
-        f"P50: {percentile(times, 50):>6.0f}ms  "
-        f"P95: {percentile(times, 95):>6.0f}ms  "
-        f"Min: {min(times):>6.0f}ms  "
-        f"Max: {max(times):>6.0f}ms  "
-        f"Avg: {statistics.mean(times):>6.0f}ms"
+        f"P50: {p50:>6.0f}ms  "
+        f"P95: {p95:>6.0f}ms  "
+        f"Min: {mn:>6.0f}ms  "
+        f"Max: {mx:>6.0f}ms  "
+        f"Avg: {avg:>6.0f}ms"
     )
 
 
@@ -84,14 +102,21 @@ def find_test_audio() -> list[Path]:
     return audio_files
 
 
-def create_test_audio() -> Optional[Path]:
-    """Create a simple test audio file with speech."""
-    try:
-        from src.voice.tts import TTS
+def create_test_audio(tts=None) -> Optional[Path]:
+    """
+    Create a simple test audio file with speech.
 
+    Args:
+        tts: Optional already-loaded TTS instance to reuse (e.g. pipeline.tts).
+            A new one is loaded if not provided.
+    """
+    try:
         print("Creating test audio file...")
-        tts = TTS(device="cuda")
-        tts.load()
+        if tts is None:
+            from src.voice.tts import TTS
+
+            tts = TTS(device="cuda")
+            tts.load()
 
         test_text = "What time is it right now?"
         fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures"
@@ -108,6 +133,14 @@ def create_test_audio() -> Optional[Path]:
         return None
 
 
+def print_no_audio_help() -> None:
+    """Print the ways to provide benchmark audio."""
+    print("\nNo audio files available. Options:")
+    print("  1. Run TTS benchmark first: python benchmarks/tts_benchmark.py")
+    print("  2. Create test audio: python benchmarks/e2e_benchmark.py --create-audio")
+    print("  3. Specify custom audio: python benchmarks/e2e_benchmark.py --audio file.wav")
+
+
 def run_benchmark(
     pipeline,
     audio_files: list[Path],
@@ -126,39 +159,74 @@ def run_benchmark(
     Returns:
         BenchmarkResults with timing data
     """
-    results = BenchmarkResults()
+    results = BenchmarkResults(
+        stt_times=np.empty(iterations, dtype=np.int32),
+        llm_first_times=np.empty(iterations, dtype=np.int32),
+        tts_first_times=np.empty(iterations, dtype=np.int32),
+        e2e_times=np.empty(iterations, dtype=np.int32),
+    )
+    idx = 0  # Next free slot (successful non-warmup runs only)
 
     total_runs = warmup + iterations
 
     print(f"\nRunning {warmup} warmup + {iterations} benchmark iterations...")
     print("-" * 60)
 
+    # Per-run records are buffered and emitted as JSON after the loop, so no
+    # terminal I/O happens between runs.
+    log_entries: list[dict] = []
+
     for i in range(total_runs):
         is_warmup = i < warmup
         run_num = i + 1
-        prefix = "[WARMUP]" if is_warmup else f"[{run_num - warmup}/{iterations}]"
 
         # Cycle through audio files
         audio_file = audio_files[i % len(audio_files)]
-
-        print(f"{prefix} Processing: {audio_file.name}...", end=" ", flush=True)
+        entry = {"run": run_num, "warmup": is_warmup, "audio": audio_file.name}
 
         try:
-            metrics = pipeline.process_file(str(audio_file))
-
-            print(f"E2E: {metrics.e2e_ms:.0f}ms")
+            # Record stage timestamps (perf_counter_ns) as the pipeline emits them
+            stamps = {}
+            metrics = None
+            for event, value in pipeline.process_file_streaming(str(audio_file)):
+                if event == "done":
+                    metrics = value
+                else:
+                    stamps[event] = value
+
+            t_start = stamps["start"]
+            t_stt = stamps.get("stt_done", t_start)
+            t_llm = stamps.get("llm_first", t_stt)
+            t_tts = stamps.get("tts_first", t_llm)
+            entry.update(
+                stt=(t_stt - t_start) // 1_000_000,
+                llm_first=(t_llm - t_stt) // 1_000_000,
+                tts_first=(t_tts - t_llm) // 1_000_000,
+                e2e=round(metrics.e2e_ms),
+            )
 
             if not is_warmup:
-                results.stt_times.append(metrics.stt_ms)
-                results.llm_first_times.append(metrics.llm_first_token_ms)
-                results.tts_first_times.append(metrics.tts_first_audio_ms)
-                results.e2e_times.append(metrics.e2e_ms)
+                results.stt_times[idx] = entry["stt"]
+                results.llm_first_times[idx] = entry["llm_first"]
+                results.tts_first_times[idx] = entry["tts_first"]
+                results.e2e_times[idx] = entry["e2e"]
+                idx += 1
                 results.transcriptions.append(metrics.user_text)
                 results.responses.append(metrics.jett_text)
 
         except Exception as e:
-            print(f"ERROR: {e}")
-            continue
+            entry["error"] = str(e)
+
+        log_entries.append(entry)
+
+    json.dump(log_entries, sys.stdout, indent=1)
+    print()
+
+    # Drop slots left unfilled by failed runs
+    results.stt_times = results.stt_times[:idx]
+    results.llm_first_times = results.llm_first_times[:idx]
+    results.tts_first_times = results.tts_first_times[:idx]
+    results.e2e_times = results.e2e_times[:idx]
 
     return results
 
@@ -203,28 +271,29 @@ def main():
     else:
         audio_files = find_test_audio()
 
-        if not audio_files and args.create_audio:
-            created = create_test_audio()
-            if created:
-                audio_files = [created]
-
-        if not audio_files:
-            print("\nNo audio files available. Options:")
-            print("  1. Run TTS benchmark first: python benchmarks/tts_benchmark.py")
-            print("  2. Create test audio: python benchmarks/e2e_benchmark.py --create-audio")
-            print("  3. Specify custom audio: python benchmarks/e2e_benchmark.py --audio file.wav")
+        # With --create-audio, creation is deferred until the pipeline has
+        # loaded its TTS so the model is only loaded once.
+        if not audio_files and not args.create_audio:
+            print_no_audio_help()
             sys.exit(1)
 
-    print(f"\nUsing audio files:")
-    for f in audio_files:
-        print(f"  - {f.name}")
-
     # Initialize pipeline
     print("\nInitializing pipeline...")
     from src.voice.pipeline import VoicePipeline
     pipeline = VoicePipeline()
     pipeline.load_models()
 
+    if not audio_files:
+        created = create_test_audio(tts=pipeline.tts)
+        if not created:
+            print_no_audio_help()
+            sys.exit(1)
+        audio_files = [created]
+
+    print(f"\nUsing audio files:")
+    for f in audio_files:
+        print(f"  - {f.name}")
+
     # Run benchmark
     results = run_benchmark(
         pipeline,
@@ -247,8 +316,10 @@ def main():
 
     # Target check
     target_e2e = 500  # ms
-    p50_e2e = percentile(results.e2e_times, 50)
-    p95_e2e = percentile(results.e2e_times, 95)
+    if results.e2e_times.size:
+        p50_e2e, p95_e2e = _percentiles(results.e2e_times, (50, 95))
+    else:
+        p50_e2e = p95_e2e = 0.0
 
     print("-" * 60)
     print(f"Target E2E latency: <{target_e2e}ms")
@@ -258,9 +329,12 @@ def main():
 
     # Sample interactions
     print("\nSample Interactions:")
-    for i, (trans, resp) in enumerate(zip(results.transcriptions[:3], results.responses[:3])):
+    for i in range(min(3, len(results.transcriptions))):
+        trans = results.transcriptions[i]
+        resp = results.responses[i]
         print(f"\n  [{i+1}] User: \"{trans}\"")
-        print(f"      Jett: \"{resp[:80]}{'...' if len(resp) > 80 else ''}\"")
+        suffix = "..." if len(resp) > 80 else ""
+        print(f"      Jett: \"{resp[:80]}{suffix}\"")
 
     print()
     print("Benchmark complete.")
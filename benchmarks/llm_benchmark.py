@@ -2,7 +2,7 @@
 LLM inference benchmark for Jett voice assistant.
 
 Tests:
-1. Simple query latency (what voice assistant handles most)
+1. Simple query latency — time-to-first-token and total (what voice assistant handles most)
 2. Tool-calling format (can it produce structured output?)
 3. Tokens per second
 4. VRAM usage during inference
@@ -12,49 +12,77 @@ Usage: python benchmarks/llm_benchmark.py
 
 import time
 import json
-import subprocess
+from pathlib import Path
+
 import requests
 
+from _nvml import get_vram_mb
+
 OLLAMA_URL = "http://localhost:11434/api/generate"
 MODEL = "qwen3:8b"
 
-def get_vram_mb() -> int:
-    """Get current VRAM usage in MB."""
-    result = subprocess.run(
-        ["nvidia-smi", "--query-gpu=memory.used", "--format=csv,noheader,nounits"],
-        capture_output=True, text=True
-    )
-    return int(result.stdout.strip())
+# Prompts live in a shared asset; request bodies are serialized once up front
+with open(Path(__file__).parent / "prompts.json", encoding="utf-8") as f:
+    PROMPTS = [(p["label"], p["prompt"]) for p in json.load(f)["llm_benchmark"]]
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+PREVIEW_CHARS = 100
 
-def benchmark_query(prompt: str, label: str) -> dict:
-    """Benchmark a single query."""
-    start = time.perf_counter()
 
-    response = requests.post(OLLAMA_URL, json={
-        "model": MODEL,
-        "prompt": prompt,
-        "stream": False
-    })
+def _request_body(prompt: str) -> bytes:
+    return json.dumps({"model": MODEL, "prompt": prompt, "stream": True}).encode()
+
 
-    elapsed_ms = (time.perf_counter() - start) * 1000
-    data = response.json()
+PROMPT_BODIES = {prompt: _request_body(prompt) for _, prompt in PROMPTS}
 
+# Shared session so every Ollama call reuses a pooled keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+def benchmark_query(prompt: str, label: str) -> dict:
+    """Benchmark a single query, separating time-to-first-token from total latency."""
+    start_ns = time.perf_counter_ns()
+    ttft_ms = None
+    preview = ""  # Only the first PREVIEW_CHARS are kept; the rest is just counted
+    data = {}
+
+    body = PROMPT_BODIES.get(prompt) or _request_body(prompt)
+    response = SESSION.post(OLLAMA_URL, data=body, headers=JSON_HEADERS, stream=True)
+
+    for line in response.iter_lines():
+        if not line:
+            continue
+        data = json.loads(line)
+        chunk = data.get("response", "")
+        if chunk:
+            if ttft_ms is None:
+                ttft_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            if len(preview) < PREVIEW_CHARS:
+                preview += chunk
+        if data.get("done", False):
+            break
+
+    total_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    # Final frame (done=True) carries the decode stats
     tokens = data.get("eval_count", 0)
     eval_duration_ns = data.get("eval_duration", 1)
     tokens_per_sec = (tokens / eval_duration_ns) * 1e9 if eval_duration_ns else 0
 
     result = {
         "label": label,
-        "latency_ms": round(elapsed_ms, 1),
+        "ttft_ms": ttft_ms or 0,
+        "total_ms": total_ms,
         "tokens": tokens,
         "tokens_per_sec": round(tokens_per_sec, 1),
-        "response_preview": data.get("response", "")[:100]
+        "response_preview": preview[:PREVIEW_CHARS]
     }
 
     print(f"\n{'='*50}")
     print(f"  {label}")
-    print(f"  Latency: {result['latency_ms']}ms")
+    print(f"  First token: {result['ttft_ms']}ms")
+    print(f"  Total: {result['total_ms']}ms")
     print(f"  Tokens: {result['tokens']}")
     print(f"  Speed: {result['tokens_per_sec']} tok/s")
     print(f"  Response: {result['response_preview']}...")
@@ -69,29 +97,8 @@ def main():
 
     results = []
 
-    # Test 1: Simple query (most common for voice assistant)
-    results.append(benchmark_query(
-        "What time is it in Tokyo? Answer in one sentence.",
-        "Simple Query"
-    ))
-
-    # Test 2: Command interpretation
-    results.append(benchmark_query(
-        "The user said: 'restart the database'. What container action should be taken? Reply with just the action and container name.",
-        "Command Interpretation"
-    ))
-
-    # Test 3: Slightly complex
-    results.append(benchmark_query(
-        "Explain what Docker containers are in 2-3 sentences for someone new to infrastructure.",
-        "Short Explanation"
-    ))
-
-    # Test 4: Tool calling format
-    results.append(benchmark_query(
-        'You have access to a function called container_action(action, container). The user says "restart n8n". Respond with ONLY the function call in JSON format: {"action": "...", "container": "..."}',
-        "Tool Call Format"
-    ))
+    for label, prompt in PROMPTS:
+        results.append(benchmark_query(prompt, label))
 
     print(f"\n{'='*50}")
     print(f"  VRAM after: {get_vram_mb()} MB")
@@ -99,10 +106,10 @@ def main():
 
     # Summary
     print("\n SUMMARY")
-    print(f"{'Label':<25} {'Latency':>10} {'Tokens/s':>10}")
-    print("-" * 50)
+    print(f"{'Label':<25} {'TTFT':>10} {'Total':>10} {'Tokens/s':>10}")
+    print("-" * 60)
     for r in results:
-        print(f"{r['label']:<25} {r['latency_ms']:>8.0f}ms {r['tokens_per_sec']:>8.1f}")
+        print(f"{r['label']:<25} {r['ttft_ms']:>8.0f}ms {r['total_ms']:>8.0f}ms {r['tokens_per_sec']:>10.1f}")
 
     print(f"\nVRAM Usage: {get_vram_mb()} MB")
     print(f"VRAM Budget: 4500 MB")
@@ -4,65 +4,102 @@ Quick A/B comparison: Qwen3 8B vs 4B for time-to-first-token.
 Usage: python benchmarks/llm_comparison.py
 """
 
+import json
 import time
+from pathlib import Path
+
 import requests
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional — stdlib json also accepts bytes
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 OLLAMA_URL = "http://localhost:11434/api/chat"
 
-PROMPTS = [
-    "What time is it?",
-    "Restart the n8n container",
-    "How's the database doing?",
-    "List all running containers",
-    "What can you help me with?",
-]
+# Prompts live in a shared asset (see also llm_benchmark.py)
+with open(Path(__file__).parent / "prompts.json", encoding="utf-8") as f:
+    PROMPTS = json.load(f)["llm_comparison"]
 
 MODELS = ["jett-qwen3", "qwen3:4b"]
 
+# Thinking-block markers, matched against raw NDJSON bytes before parsing.
+# Ollama's Go encoder escapes '<'/'>' as \u003c/\u003e, so check both forms.
+THINK_MARKERS = (
+    b"<think>", b"</think>",
+    b"\\u003cthink\\u003e", b"\\u003c/think\\u003e",
+)
+
+NO_THINK_SUFFIX = " /no_think"
+JSON_HEADERS = {"Content-Type": "application/json"}
+PREVIEW_CHARS = 50
+
+
+def _request_body(model: str, prompt: str) -> bytes:
+    return _dumps({
+        "model": model,
+        "messages": [{"role": "user", "content": prompt + NO_THINK_SUFFIX}],
+        "stream": True,
+    })
+
+
+# Serialize every (model, prompt) request body once up front
+PROMPT_BODIES = {
+    (model, prompt): _request_body(model, prompt)
+    for model in MODELS
+    for prompt in PROMPTS
+}
+
+# Shared session so every Ollama call reuses a pooled keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
-def warm_up_model(model: str):
-    """Pre-load model into VRAM."""
-    print(f"  Warming up {model}...", end=" ", flush=True)
+def warm_up_model(model: str) -> float:
+    """Pre-load model into VRAM. Returns elapsed seconds."""
     start = time.perf_counter()
-    requests.post(OLLAMA_URL, json={
+    SESSION.post(OLLAMA_URL, json={
         "model": model,
         "messages": [{"role": "user", "content": "hi"}],
         "stream": False,
         "options": {"num_predict": 5}
     }, timeout=120)
-    elapsed = time.perf_counter() - start
-    print(f"done ({elapsed:.1f}s)")
+    return time.perf_counter() - start
 
 
-def measure_first_token(model: str, prompt: str) -> tuple[float, str]:
-    """Measure time to first token."""
-    start = time.perf_counter()
+def measure_first_token(model: str, prompt: str) -> tuple[int, str]:
+    """Measure time to first token (integer ms)."""
+    start_ns = time.perf_counter_ns()
     first_token_time = None
     response_text = ""
 
-    response = requests.post(OLLAMA_URL, json={
-        "model": model,
-        "messages": [{"role": "user", "content": f"{prompt} /no_think"}],
-        "stream": True
-    }, stream=True, timeout=60)
-
-    for line in response.iter_lines():
-        if line:
-            import json
-            data = json.loads(line)
-            if "message" in data and "content" in data["message"]:
-                content = data["message"]["content"]
-                # Skip thinking blocks
-                if "<think>" in content or "</think>" in content:
-                    continue
-                if content.strip():
-                    if first_token_time is None:
-                        first_token_time = (time.perf_counter() - start) * 1000
-                    response_text += content
-            if data.get("done", False):
-                break
-
-    return first_token_time or 0, response_text[:50]
+    body = PROMPT_BODIES.get((model, prompt)) or _request_body(model, prompt)
+    response = SESSION.post(
+        OLLAMA_URL, data=body, headers=JSON_HEADERS, stream=True, timeout=60
+    )
+
+    for line in response.iter_lines(decode_unicode=False):
+        if not line:
+            continue
+        # Skip thinking frames without paying for a JSON parse
+        if any(marker in line for marker in THINK_MARKERS):
+            continue
+        data = _loads(line)
+        content = data.get("message", {}).get("content")
+        if content and content.strip():
+            if first_token_time is None:
+                first_token_time = (time.perf_counter_ns() - start_ns) // 1_000_000
+            if len(response_text) < PREVIEW_CHARS:
+                response_text += content
+        if data.get("done", False):
+            break
+
+    return first_token_time or 0, response_text[:PREVIEW_CHARS]
 
 
 def main():
@@ -74,10 +111,16 @@ def main():
 
     for model in MODELS:
         print(f"\nTesting: {model}")
-        warm_up_model(model)
 
+        # Warm right before measuring: with both models on an 8 GB GPU,
+        # Ollama may evict whichever was loaded earlier
+        elapsed = warm_up_model(model)
+        print(f"  Warm-up: {elapsed:.1f}s")
+
+        # One prompt at a time: concurrent requests queue (or share compute)
+        # inside Ollama, which would add earlier generations to each TTFT
         for prompt in PROMPTS:
-            ttft, preview = measure_first_token(model, prompt)
+            ttft, _ = measure_first_token(model, prompt)
             results[model].append(ttft)
             print(f"  {prompt[:30]:<30} -> {ttft:>6.0f}ms")
 
@@ -17,34 +17,45 @@ Usage: python benchmarks/vram_validation.py
 """
 
 import os
-import subprocess
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 import requests
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional — stdlib json also accepts bytes
+    import json
+    _loads = json.loads
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _model_daemon import connect as connect_model_daemon
+from _nvml import get_vram_mb
+
 # Suppress warnings
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
-
-def get_vram_mb() -> int:
-    """Get current VRAM usage in MB."""
-    result = subprocess.run(
-        ["nvidia-smi", "--query-gpu=memory.used", "--format=csv,noheader,nounits"],
-        capture_output=True, text=True
-    )
-    return int(result.stdout.strip())
+# Shared session so every Ollama call reuses a pooled keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 def check_ollama_model_loaded() -> bool:
-    """Check if Ollama has jett-qwen3 loaded."""
+    """Check if Ollama has jett-qwen3 loaded (cached for ~1s)."""
+    return _check_ollama_model_loaded(int(time.monotonic()))
+
+
+@lru_cache(maxsize=1)
+def _check_ollama_model_loaded(_time_bucket: int) -> bool:
+    """Uncached /api/ps query; the time bucket argument expires the cache."""
     try:
-        resp = requests.get("http://localhost:11434/api/ps")
-        models = resp.json().get("models", [])
+        resp = SESSION.get("http://localhost:11434/api/ps")
+        models = _loads(resp.content).get("models", [])
         return any("qwen" in m.get("name", "").lower() for m in models)
     except:
         return False
@@ -54,7 +65,7 @@ def warm_up_llm():
     """Send a request to Ollama to ensure model is loaded."""
     print("Warming up LLM...")
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             "http://localhost:11434/api/generate",
             json={"model": "jett-qwen3", "prompt": "Hi", "stream": False},
             timeout=120
@@ -70,6 +81,13 @@ def main():
     print(" JETT VRAM VALIDATION - ALL THREE MODELS")
     print("=" * 60)
 
+    # Models kept hot by benchmarks/_model_daemon.py would already be in the
+    # baseline, so every per-model delta would read ~0
+    if connect_model_daemon() is not None:
+        print("\nThe model daemon is running and holds STT/TTS in VRAM.")
+        print("Stop it (Ctrl+C in its terminal) and re-run.")
+        sys.exit(1)
+
     # Step 1: Baseline
     baseline = get_vram_mb()
     print(f"\n[1/4] Baseline VRAM: {baseline} MB")
@@ -89,7 +107,8 @@ def main():
     print(f"\n[3/4] Loading STT (faster-whisper)...")
     from src.voice.stt import STT
 
-    stt = STT(model_size="distil-large-v3", device="cuda", compute_type="int8")
+    # Same STT configuration the voice pipeline loads by default
+    stt = STT(device="cuda")
     stt.load()
 
     vram_after_stt = get_vram_mb()
@@ -153,12 +172,12 @@ def main():
 
     # Test LLM
     print("LLM: Testing inference...")
-    resp = requests.post(
+    resp = SESSION.post(
         "http://localhost:11434/api/generate",
         json={"model": "jett-qwen3", "prompt": "Say hello in 5 words.", "stream": False},
         timeout=30
     )
-    llm_response = resp.json().get("response", "")[:50]
+    llm_response = _loads(resp.content).get("response", "")[:50]
     print(f"LLM response: {llm_response}...")
 
     # Test TTS
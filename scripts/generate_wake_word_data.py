@@ -7,7 +7,9 @@ produce diverse voice samples for openWakeWord fine-tuning.
 
 Prerequisites:
     pip install edge-tts
-    ffmpeg must be in PATH  (winget install Gyan.FFmpeg)
+    pip install soxr       (optional — faster resampling)
+    pip install miniaudio  (optional — in-process MP3 decode)
+    ffmpeg must be in PATH without miniaudio  (winget install Gyan.FFmpeg)
 
 Usage:
     python scripts/generate_wake_word_data.py
@@ -23,16 +25,27 @@ import csv
 import os
 import random
 import shutil
-import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
 from scipy.signal import resample as scipy_resample
 
+try:
+    import miniaudio  # in-process MP3 decode — no ffmpeg spawn per clip
+except ImportError:
+    miniaudio = None
+
+try:
+    import soxr  # SIMD polyphase resampler, much faster than FFT resample
+except ImportError:
+    soxr = None
+
 
 # ─── Configuration ───────────────────────────────────────────────────────────
 
@@ -117,6 +130,13 @@ EDGE_POS_RATES = [
     ("slow",   "-12%"),
 ]
 
+# Max edge-tts requests (and MP3 decodes) in flight at once
+EDGE_CONCURRENCY = 16
+
+# Background WAV writers, and how many finished clips may wait on them
+WRITER_THREADS = 2
+WRITE_QUEUE_DEPTH = 32
+
 
 # ─── Audio Utilities ─────────────────────────────────────────────────────────
 
@@ -125,6 +145,8 @@ def resample_audio(audio, src_sr, target_sr, pitch_factor=1.0):
     effective_sr = src_sr * pitch_factor
     if effective_sr == target_sr:
         return audio
+    if soxr is not None:
+        return soxr.resample(audio, effective_sr, target_sr)
     n = int(len(audio) * target_sr / effective_sr)
     return scipy_resample(audio, n) if n > 0 else audio
 
@@ -134,24 +156,39 @@ def trim_silence(audio, threshold=0.01, pad=800):
     mask = np.abs(audio) > threshold
     if not mask.any():
         return audio
-    idx = np.where(mask)[0]
-    lo = max(0, idx[0] - pad)
-    hi = min(len(audio), idx[-1] + pad)
+    # argmax stops at the first True — no full index array like np.where
+    first = int(np.argmax(mask))
+    last = len(mask) - 1 - int(np.argmax(mask[::-1]))
+    lo = max(0, first - pad)
+    hi = min(len(audio), last + pad)
     return audio[lo:hi]
 
 
 def save_wav(audio, path, sr=TARGET_SR):
     """Save as 16kHz mono 16-bit PCM WAV. Returns duration in seconds."""
-    peak = np.max(np.abs(audio))
-    if peak > 0:
-        audio = audio / peak * 0.95
-    audio_i16 = (audio * 32767).astype(np.int16)
+    # Peak from max/min avoids an np.abs temporary; normalization and int16
+    # scaling are folded into one multiply before the cast.
+    peak = max(float(audio.max()), -float(audio.min())) if len(audio) else 0.0
+    scale = 0.95 * 32767 / peak if peak > 0 else 32767.0
+    audio_i16 = np.multiply(audio, scale, dtype=np.float32).astype(np.int16)
     sf.write(str(path), audio_i16, sr, subtype="PCM_16")
     return len(audio_i16) / sr
 
 
 # ─── Kokoro Generation ──────────────────────────────────────────────────────
 
+def _kokoro_synthesize(pipe, phrases, voice, speed):
+    """Synthesize all phrases in one pipeline pass. Returns audio per phrase (None if empty)."""
+    import torch
+
+    chunks = [[] for _ in phrases]
+    # A list input makes Kokoro tag each result with its text_index
+    for r in pipe(phrases, voice=voice, speed=speed):
+        chunks[r.text_index].append(r.audio)
+    # Join on-device so each clip costs one device→host copy, not one per chunk
+    return [torch.cat(c).cpu().numpy() if c else None for c in chunks]
+
+
 def generate_kokoro(manifest, sample_type):
     """Generate samples with Kokoro TTS. Returns count."""
     os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
@@ -166,97 +203,161 @@ def generate_kokoro(manifest, sample_type):
     count = 0
     errors = 0
 
+    # Group variations by speed — only speed changes the model output
+    speed_groups = {}
+    for var_label, speed, pitch in variations:
+        speed_groups.setdefault(speed, []).append((var_label, pitch))
+
     # Group by lang_code to minimize pipeline reloads (2 loads: 'a' and 'b')
     groups = {}
     for lc, vid in voices:
         groups.setdefault(lc, []).append(vid)
 
+    # Disk writes run on a small pool so they overlap synthesis; the
+    # semaphore caps how much finished audio can queue up in RAM.
+    writer = ThreadPoolExecutor(max_workers=WRITER_THREADS)
+    write_slots = threading.BoundedSemaphore(WRITE_QUEUE_DEPTH)
+    pending = []
+
     for lang_code, voice_ids in groups.items():
         print(f"  Loading Kokoro pipeline (lang={lang_code})...")
         pipe = KPipeline(
             lang_code=lang_code, repo_id="hexgrad/Kokoro-82M", device="cuda"
         )
 
-        for vid in voice_ids:
-            for pi, phrase in enumerate(phrases):
-                for var_label, speed, pitch in variations:
-                    try:
-                        chunks = [
-                            r.audio.cpu().numpy()
-                            for r in pipe(phrase, voice=vid, speed=speed)
-                        ]
-                        if not chunks:
+        jobs = [
+            (vid, speed, pitch_vars)
+            for vid in voice_ids
+            for speed, pitch_vars in speed_groups.items()
+        ]
+
+        # A single worker owns the pipeline (G2P + GPU forward) and runs
+        # ahead, while this thread resamples, trims and saves finished clips.
+        with ThreadPoolExecutor(max_workers=1) as synth_pool:
+            futures = [
+                synth_pool.submit(_kokoro_synthesize, pipe, phrases, vid, speed)
+                for vid, speed, _ in jobs
+            ]
+
+            for (vid, speed, pitch_vars), future in zip(jobs, futures):
+                try:
+                    clips = future.result()
+                except Exception as e:
+                    errors += len(phrases) * len(pitch_vars)
+                    print(f"  Skip: kokoro/{vid}/speed={speed} -- {e}")
+                    continue
+
+                for pi, phrase in enumerate(phrases):
+                    raw = clips[pi]
+                    if raw is None:
+                        errors += len(pitch_vars)
+                        continue
+
+                    # Pitch variants only differ in resampling, so they
+                    # share the synthesized audio
+                    for var_label, pitch in pitch_vars:
+                        try:
+                            audio = resample_audio(raw, KOKORO_SR, TARGET_SR, pitch)
+                            audio = trim_silence(audio)
+
+                            dur = len(audio) / TARGET_SR
+                            if not (0.3 <= dur <= 4.0):
+                                continue
+
+                            fname = f"kokoro_{vid}_p{pi}_{var_label}.wav"
+                            write_slots.acquire()
+                            future = writer.submit(save_wav, audio, out_dir / fname)
+                            future.add_done_callback(lambda _: write_slots.release())
+
+                            pending.append((future, dict(
+                                filename=fname, phrase=phrase, voice=vid,
+                                engine="kokoro", type=sample_type,
+                                variation=var_label, duration_s=f"{dur:.2f}",
+                            )))
+                            count += 1
+
+                            if count % 50 == 0:
+                                print(f"  Kokoro {sample_type}: {count}/{total_est}")
+
+                        except Exception as e:
                             errors += 1
-                            continue
-
-                        audio = np.concatenate(chunks)
-                        audio = resample_audio(audio, KOKORO_SR, TARGET_SR, pitch)
-                        audio = trim_silence(audio)
-
-                        dur = len(audio) / TARGET_SR
-                        if not (0.3 <= dur <= 4.0):
-                            continue
-
-                        fname = f"kokoro_{vid}_p{pi}_{var_label}.wav"
-                        save_wav(audio, out_dir / fname)
-
-                        manifest.append(dict(
-                            filename=fname, phrase=phrase, voice=vid,
-                            engine="kokoro", type=sample_type,
-                            variation=var_label, duration_s=f"{dur:.2f}",
-                        ))
-                        count += 1
-
-                        if count % 50 == 0:
-                            print(f"  Kokoro {sample_type}: {count}/{total_est}")
-
-                    except Exception as e:
-                        errors += 1
-                        print(f"  Skip: kokoro/{vid}/p{pi}/{var_label} -- {e}")
+                            print(f"  Skip: kokoro/{vid}/p{pi}/{var_label} -- {e}")
 
         del pipe  # free GPU memory before loading next lang
 
+    # Only clips whose write succeeded make it into the manifest
+    writer.shutdown(wait=True)
+    for future, entry in pending:
+        if future.exception() is not None:
+            count -= 1
+            errors += 1
+            print(f"  Skip: kokoro/{entry['filename']} -- {future.exception()}")
+        else:
+            manifest.append(entry)
+
     print(f"  Kokoro {sample_type} done: {count} samples ({errors} errors)")
     return count
 
 
 # ─── Edge-TTS Generation ────────────────────────────────────────────────────
 
+def _decode_mp3(path):
+    """Decode an MP3 to 16kHz mono float32 in-process via miniaudio."""
+    decoded = miniaudio.decode_file(
+        str(path), output_format=miniaudio.SampleFormat.SIGNED16,
+        nchannels=1, sample_rate=TARGET_SR,
+    )
+    return np.frombuffer(decoded.samples, dtype=np.int16).astype(np.float32) / 32768
+
+
 async def _edge_one(voice, text, rate, out_path, tmp_dir):
-    """Generate one edge-tts sample. Returns True on success."""
+    """Generate one edge-tts sample. Returns its duration in seconds, or None on failure."""
     import edge_tts
 
     tmp_mp3 = Path(tmp_dir) / f"{voice}_{abs(hash(text + rate))}.mp3"
     try:
         await edge_tts.Communicate(text, voice, rate=rate).save(str(tmp_mp3))
 
-        result = subprocess.run(
-            ["ffmpeg", "-y", "-loglevel", "error",
-             "-i", str(tmp_mp3),
-             "-ar", str(TARGET_SR), "-ac", "1",
-             "-acodec", "pcm_s16le", str(out_path)],
-            capture_output=True, timeout=30,
-        )
-        tmp_mp3.unlink(missing_ok=True)
-
-        if result.returncode != 0:
-            return False
+        if miniaudio is not None:
+            audio = await asyncio.to_thread(_decode_mp3, tmp_mp3)
+            sr = TARGET_SR
+            tmp_mp3.unlink(missing_ok=True)
+        else:
+            # Async subprocess so concurrent ffmpeg runs don't block the event loop
+            proc = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-i", str(tmp_mp3),
+                "-ar", str(TARGET_SR), "-ac", "1",
+                "-acodec", "pcm_s16le", str(out_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                raise
+            tmp_mp3.unlink(missing_ok=True)
+
+            if returncode != 0:
+                return None
+
+            audio, sr = sf.read(str(out_path))
 
-        audio, sr = sf.read(str(out_path))
         audio = trim_silence(audio)
         dur = len(audio) / sr
 
         if not (0.3 <= dur <= 4.0):
             out_path.unlink(missing_ok=True)
-            return False
+            return None
 
-        save_wav(audio, out_path, sr)
-        return True
+        await asyncio.to_thread(save_wav, audio, out_path, sr)
+        return dur
 
     except Exception:
         tmp_mp3.unlink(missing_ok=True)
         out_path.unlink(missing_ok=True)
-        return False
+        return None
 
 
 async def generate_edge(manifest, sample_type):
@@ -270,29 +371,43 @@ async def generate_edge(manifest, sample_type):
     count = 0
     errors = 0
 
+    jobs = []
+    for voice in voices:
+        for pi, phrase in enumerate(phrases):
+            for rl, rate_str in rates:
+                safe_v = voice.replace("-", "_")
+                fname = f"edge_{safe_v}_p{pi}_{rl}.wav"
+                jobs.append((voice, phrase, rl, rate_str, fname))
+
     with tempfile.TemporaryDirectory() as tmp:
-        for voice in voices:
-            for pi, phrase in enumerate(phrases):
-                for rl, rate_str in rates:
-                    safe_v = voice.replace("-", "_")
-                    fname = f"edge_{safe_v}_p{pi}_{rl}.wav"
-                    fpath = out_dir / fname
-
-                    ok = await _edge_one(voice, phrase, rate_str, fpath, tmp)
-                    if ok:
-                        audio, sr = sf.read(str(fpath))
-                        dur = len(audio) / sr
-                        manifest.append(dict(
-                            filename=fname, phrase=phrase, voice=voice,
-                            engine="edge-tts", type=sample_type,
-                            variation=rl, duration_s=f"{dur:.2f}",
-                        ))
-                        count += 1
-                    else:
-                        errors += 1
-
-                    if count % 50 == 0 and count > 0:
-                        print(f"  edge-tts {sample_type}: {count}/{total_est}")
+        # Each sample is an HTTP round-trip plus a decode — overlap them
+        sem = asyncio.Semaphore(EDGE_CONCURRENCY)
+        done = 0
+
+        async def run_one(voice, phrase, rate_str, fname):
+            nonlocal done
+            async with sem:
+                dur = await _edge_one(voice, phrase, rate_str, out_dir / fname, tmp)
+            done += 1
+            if done % 50 == 0:
+                print(f"  edge-tts {sample_type}: {done}/{total_est}")
+            return dur
+
+        durations = await asyncio.gather(*(
+            run_one(voice, phrase, rate_str, fname)
+            for voice, phrase, _, rate_str, fname in jobs
+        ))
+
+    for (voice, phrase, rl, _, fname), dur in zip(jobs, durations):
+        if dur is not None:
+            manifest.append(dict(
+                filename=fname, phrase=phrase, voice=voice,
+                engine="edge-tts", type=sample_type,
+                variation=rl, duration_s=f"{dur:.2f}",
+            ))
+            count += 1
+        else:
+            errors += 1
 
     print(f"  edge-tts {sample_type} done: {count} samples ({errors} errors)")
     return count
@@ -307,9 +422,11 @@ def validate(directory, n=5):
         print("  (no files)")
         return
     for f in random.sample(wavs, min(n, len(wavs))):
-        audio, sr = sf.read(str(f))
-        dur = len(audio) / sr
-        mono = audio.ndim == 1
+        # Header only — format checks don't need the samples decoded
+        info = sf.info(str(f))
+        sr = info.samplerate
+        dur = info.frames / sr
+        mono = info.channels == 1
         ok = sr == TARGET_SR and mono and 0.2 < dur < 5.0
         tag = "OK" if ok else "!!"
         ch = "mono" if mono else "STEREO"
@@ -322,9 +439,9 @@ def main():
     t0 = time.time()
 
     # ── Pre-flight checks ────────────────────────────────────────
-    if not shutil.which("ffmpeg"):
+    if miniaudio is None and not shutil.which("ffmpeg"):
         sys.exit(
-            "ERROR: ffmpeg not found in PATH.\n"
+            "ERROR: ffmpeg not found in PATH (needed without miniaudio).\n"
             "Install:  winget install Gyan.FFmpeg\n"
             "Then restart your terminal."
         )
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Quantize the "Hey Jett" wake-word classifier to INT8.
+
+Dynamic quantization stores the ONNX weights as int8 and quantizes
+activations at run time, shrinking the model and speeding up the
+per-chunk inference that runs continuously on the CPU.
+
+Prerequisites:
+    pip install onnxruntime
+
+Usage:
+    python scripts/quantize_wakeword.py
+    python scripts/quantize_wakeword.py path/to/model.onnx
+
+Output:
+    <model>.int8.onnx next to the input (models/hey_jett.int8.onnx by
+    default), picked up by WakeWordDetector(quantized=True)
+"""
+
+import sys
+from pathlib import Path
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+DEFAULT_MODEL = Path(__file__).parent.parent / "models" / "hey_jett.onnx"
+
+
+def main():
+    model_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_MODEL
+    if not model_path.exists():
+        print(f"Model not found: {model_path}")
+        sys.exit(1)
+
+    out_path = model_path.with_suffix(".int8.onnx")
+    quantize_dynamic(model_path, out_path, weight_type=QuantType.QInt8)
+
+    in_kb = model_path.stat().st_size / 1024
+    out_kb = out_path.stat().st_size / 1024
+    print(f"{model_path.name}: {in_kb:.0f} KB -> {out_path.name}: {out_kb:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
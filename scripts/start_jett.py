@@ -17,97 +17,41 @@ Requirements:
 """
 
 import argparse
-import subprocess
+import os
 import sys
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Jett models need ~6.8 GB to load fully on GPU.
-# If less is free, the LLM gets partially offloaded to CPU → 5-10x slower.
-VRAM_REQUIRED_MB = 6800
-VRAM_WARNING_MB = 7200  # Warn if headroom is slim
-
-# Known GPU-heavy processes to flag (lowercase exe names)
-GPU_HEAVY_PROCESSES = {
-    "chrome.exe": "Google Chrome (disable HW acceleration or close)",
-    "firefox.exe": "Firefox (disable HW acceleration or close)",
-    "msedge.exe": "Microsoft Edge (disable HW acceleration or close)",
-    "discord.exe": "Discord (disable HW acceleration or close)",
-    "obs64.exe": "OBS Studio",
-    "nvidia broadcast.exe": "NVIDIA Broadcast",
-    "wallpaper64.exe": "Wallpaper Engine",
-    "steamwebhelper.exe": "Steam overlay",
-}
-
-
-def get_gpu_memory() -> tuple[int, int, int]:
-    """
-    Query GPU memory via nvidia-smi.
-
-    Returns:
-        (used_mb, total_mb, free_mb)
-    """
-    result = subprocess.run(
-        [
-            "nvidia-smi",
-            "--query-gpu=memory.used,memory.total,memory.free",
-            "--format=csv,noheader,nounits",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-
-    if result.returncode != 0:
-        print(f"ERROR: nvidia-smi failed: {result.stderr.strip()}")
-        sys.exit(1)
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-    parts = result.stdout.strip().split(",")
-    return int(parts[0].strip()), int(parts[1].strip()), int(parts[2].strip())
+from src.main import fetch_ollama_models
+from src.system.vram import (
+    VRAM_REQUIRED_MB,
+    VRAM_WARNING_MB,
+    cached_gpu_snapshot,
+    exe_basename,
+    find_heavy_processes,
+)
 
 
-def get_gpu_processes() -> list[dict]:
+def report_vram(verbose: bool = False) -> tuple[bool, int]:
     """
-    Get list of processes using the GPU.
-
-    Returns:
-        List of dicts with 'pid', 'name' keys.
-    """
-    result = subprocess.run(
-        [
-            "nvidia-smi",
-            "--query-compute-apps=pid,name",
-            "--format=csv,noheader",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-
-    processes = []
-    seen_pids = set()
-    for line in result.stdout.strip().split("\n"):
-        if not line.strip() or "Insufficient Permissions" in line:
-            continue
-        parts = line.split(",", 1)
-        if len(parts) == 2:
-            pid = parts[0].strip()
-            name = parts[1].strip()
-            if pid not in seen_pids:
-                seen_pids.add(pid)
-                processes.append({"pid": pid, "name": name})
-
-    return processes
+    Check if there's enough free VRAM to run Jett, with a detailed report.
 
-
-def check_vram(verbose: bool = False) -> tuple[bool, int]:
-    """
-    Check if there's enough free VRAM to run Jett.
+    Uses the shared GPU snapshot from src.system.vram; src.main uses the
+    compact check_vram() from the same module.
 
     Returns:
         (ok, free_mb)
     """
-    used_mb, total_mb, free_mb = get_gpu_memory()
-    processes = get_gpu_processes()
+    snapshot = cached_gpu_snapshot()
+    if snapshot is None:
+        print("ERROR: could not query GPU memory (NVML and nvidia-smi unavailable)")
+        sys.exit(1)
+    used_mb, total_mb, free_mb = snapshot.used_mb, snapshot.total_mb, snapshot.free_mb
+    processes = snapshot.processes
 
     print()
     print("=" * 50)
@@ -120,23 +64,17 @@ def check_vram(verbose: bool = False) -> tuple[bool, int]:
     print()
 
     # Identify heavy processes
-    heavy_found = []
-    for proc in processes:
-        exe_name = Path(proc["name"]).name.lower()
-        for pattern, description in GPU_HEAVY_PROCESSES.items():
-            if pattern in exe_name:
-                heavy_found.append(description)
+    heavy_found = find_heavy_processes(processes)
 
     if heavy_found or verbose:
         print(f"  GPU Processes ({len(processes)} total):")
         if verbose:
             for proc in processes:
-                exe = Path(proc["name"]).name
-                print(f"    PID {proc['pid']:>6}  {exe}")
+                print(f"    PID {proc['pid']:>6}  {exe_basename(proc['name'])}")
         if heavy_found:
             print()
             print("  ** GPU-heavy apps detected: **")
-            for desc in sorted(set(heavy_found)):
+            for desc in heavy_found:
                 print(f"    - {desc}")
         print()
 
@@ -158,7 +96,7 @@ def check_vram(verbose: bool = False) -> tuple[bool, int]:
         print()
         if heavy_found:
             print("  Close these apps to free VRAM:")
-            for desc in sorted(set(heavy_found)):
+            for desc in heavy_found:
                 print(f"    - {desc}")
         else:
             print("  Close GPU-heavy apps (browsers, Discord, etc.)")
@@ -168,6 +106,21 @@ def check_vram(verbose: bool = False) -> tuple[bool, int]:
         return False, free_mb
 
 
+def exit_now(code: int, debug: bool = False) -> None:
+    """
+    Exit immediately for the early-exit paths (status probes, startup errors).
+
+    os._exit skips atexit handlers and interpreter teardown, which is all
+    these paths would spend time on. With --debug, sys.exit is used so
+    shutdown stays clean.
+    """
+    if debug:
+        sys.exit(code)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Jett Voice Assistant — VRAM-aware launcher",
@@ -190,14 +143,19 @@ def main():
     )
     args = parser.parse_args()
 
+    # Start the Ollama probe now so it overlaps the GPU query
+    ollama_models = None
+    if not args.check:
+        ollama_models = ThreadPoolExecutor(max_workers=1).submit(fetch_ollama_models)
+
     # Step 1: VRAM check
-    ok, free_mb = check_vram(verbose=args.debug)
+    ok, free_mb = report_vram(verbose=args.debug)
 
     if args.check:
-        sys.exit(0 if ok else 1)
+        exit_now(0 if ok else 1, args.debug)
 
     if not ok and not args.force:
-        sys.exit(1)
+        exit_now(1, args.debug)
 
     if not ok and args.force:
         print("  --force: Proceeding despite insufficient VRAM (expect slow LLM).")
@@ -205,22 +163,17 @@ def main():
 
     # Step 2: Check Ollama
     print("Checking Ollama...")
-    # Import here to avoid import overhead on --check
-    import requests
-
     try:
-        resp = requests.get("http://localhost:11434/api/tags", timeout=5)
-        models = resp.json().get("models", [])
-        model_names = [m.get("name", "") for m in models]
+        model_names = ollama_models.result()
 
         if not any("jett-qwen3" in name for name in model_names):
             print("ERROR: jett-qwen3 model not found in Ollama.")
             print("Run: ollama create jett-qwen3 -f models/Modelfile.jett-qwen3")
-            sys.exit(1)
+            exit_now(1, args.debug)
         print("Ollama OK")
-    except requests.exceptions.ConnectionError:
+    except (urllib.error.URLError, ConnectionError):
         print("ERROR: Ollama is not running. Start it first: ollama serve")
-        sys.exit(1)
+        exit_now(1, args.debug)
 
     # Step 3: Load and run pipeline
     print()
@@ -1,13 +1,44 @@
 """
 Claude API streaming wrapper.
 
-Thin wrapper around the Anthropic Python SDK that yields tokens one at a time,
-matching the same generator interface as Ollama streaming.
+Thin wrapper around the Anthropic Python SDK that yields text as it streams,
+matching the same generator interface as Ollama streaming. Tiny deltas are
+coalesced into chunks of at least `min_chunk` characters (or up to a
+punctuation boundary) to cut per-token generator overhead downstream.
 """
 
 import os
+import threading
 from typing import Generator, Optional
 
+# One Anthropic client per API key, shared by every CloudLLM so they reuse
+# the same connection pool instead of each opening its own
+_CLIENT_CACHE: dict[str, object] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str):
+    """Return the shared Anthropic client for api_key, creating it on first use."""
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            import anthropic
+            # Voice turns can't wait out retry backoff — fail fast instead
+            client = anthropic.Anthropic(api_key=api_key, max_retries=0)
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
+def warm_import() -> None:
+    """Import the Anthropic SDK in the background so the first cloud query skips it."""
+    def _import():
+        try:
+            import anthropic  # noqa: F401
+        except ImportError:
+            pass
+
+    threading.Thread(target=_import, daemon=True).start()
+
 
 class CloudLLM:
     """
@@ -23,14 +54,19 @@ class CloudLLM:
         "Be direct and conversational."
     )
 
+    # A delta ending in one of these flushes the buffer early
+    FLUSH_CHARS = ".,!?;:\n"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = "claude-sonnet-4-5-20250929",
         max_tokens: int = 150,
+        min_chunk: int = 16,
     ):
         self.model = model
         self.max_tokens = max_tokens
+        self.min_chunk = min_chunk
         self._client = None
 
         # Resolve API key: explicit > env var
@@ -42,21 +78,21 @@ class CloudLLM:
         return self._api_key is not None
 
     def _ensure_client(self):
-        """Lazy-init the Anthropic client."""
+        """Lazy-init the Anthropic client (shared per API key)."""
         if self._client is None:
             if not self._api_key:
                 raise RuntimeError(
                     "No API key. Set ANTHROPIC_API_KEY env var or pass api_key."
                 )
-            import anthropic
-            self._client = anthropic.Anthropic(api_key=self._api_key)
+            self._client = _get_client(self._api_key)
 
     def stream(self, prompt: str) -> Generator[str, None, None]:
         """
         Stream a response from Claude API.
 
         Yields:
-            Text chunks as they arrive from the API.
+            Text chunks of at least min_chunk characters, or ending at a
+            punctuation boundary; the final chunk may be shorter.
         """
         try:
             self._ensure_client()
@@ -71,8 +107,18 @@ class CloudLLM:
                 system=self.SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}],
             ) as stream:
+                buf = []
+                size = 0
                 for text in stream.text_stream:
-                    if text:
-                        yield text
+                    if not text:
+                        continue
+                    buf.append(text)
+                    size += len(text)
+                    if size >= self.min_chunk or text[-1] in self.FLUSH_CHARS:
+                        yield "".join(buf)
+                        buf.clear()
+                        size = 0
+                if buf:
+                    yield "".join(buf)
         except Exception as e:
             yield f"[Cloud error: {e}]"
@@ -9,8 +9,15 @@ The classifier is intentionally simple (<1ms, no ML model, CPU-only).
 """
 
 import re
+import threading
+from functools import lru_cache
 from typing import Generator
 
+try:
+    import hyperscan  # Multi-pattern DFA: one linear scan, no backtracking
+except ImportError:
+    hyperscan = None
+
 # Patterns that indicate a COMPLEX query (route to cloud)
 CLOUD_PATTERNS = [
     # Reasoning / analysis
@@ -68,9 +75,81 @@ LOCAL_PATTERNS = [
 SHORT_QUERY_WORDS = 12   # Queries under this lean local
 LONG_QUERY_WORDS = 25    # Queries over this lean cloud
 
-# Compiled regex for performance
-_cloud_re = [re.compile(p, re.IGNORECASE) for p in CLOUD_PATTERNS]
-_local_re = [re.compile(p, re.IGNORECASE) for p in LOCAL_PATTERNS]
+# Each list fused into one alternation so classify() does a single regex
+# scan per list instead of a Python loop over ~20 patterns. ASCII \b, \w and
+# case folding, the same semantics as the Hyperscan databases below.
+_RE_FLAGS = re.IGNORECASE | re.ASCII
+_CLOUD_FUSED = re.compile("|".join(f"(?:{p})" for p in CLOUD_PATTERNS), _RE_FLAGS)
+_LOCAL_FUSED = re.compile("|".join(f"(?:{p})" for p in LOCAL_PATTERNS), _RE_FLAGS)
+
+
+def _build_hyperscan_db(patterns: list[str]):
+    """Compile one pattern list into a Hyperscan database."""
+    # No HS_FLAG_UCP: Hyperscan rejects \b in UCP mode, so word boundaries
+    # are ASCII here and the re patterns use re.ASCII to match
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+    )
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[p.encode() for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns),
+    )
+    return db
+
+
+if hyperscan is not None:
+    _CLOUD_HS = _build_hyperscan_db(CLOUD_PATTERNS)
+    _LOCAL_HS = _build_hyperscan_db(LOCAL_PATTERNS)
+else:
+    _CLOUD_HS = _LOCAL_HS = None
+
+# Hyperscan scratch space can't be shared by concurrent scans: one per
+# thread per database
+_hs_local = threading.local()
+
+
+def _scratch_for(db):
+    scratches = getattr(_hs_local, "scratches", None)
+    if scratches is None:
+        scratches = _hs_local.scratches = {}
+    scratch = scratches.get(id(db))
+    if scratch is None:
+        scratch = scratches[id(db)] = hyperscan.Scratch(db)
+    return scratch
+
+
+def _stop_scan(pattern_id, start, end, flags, context):
+    """Hyperscan match callback: returning True halts the scan at the first hit."""
+    return True
+
+
+def _has_match(db, fused: re.Pattern, text: str) -> bool:
+    """True if any pattern in the list matches, stopping at the first hit."""
+    if db is None:
+        return fused.search(text) is not None
+    try:
+        db.scan(text.encode(), match_event_handler=_stop_scan, scratch=_scratch_for(db))
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _has_cloud_signal(text: str) -> bool:
+    return _has_match(_CLOUD_HS, _CLOUD_FUSED, text)
+
+
+def _has_local_signal(text: str) -> bool:
+    return _has_match(_LOCAL_HS, _LOCAL_FUSED, text)
+
+
+# Per-pattern regex, only for explain() which reports every matching pattern
+_cloud_re: tuple[re.Pattern, ...] = tuple(re.compile(p, _RE_FLAGS) for p in CLOUD_PATTERNS)
+_local_re: tuple[re.Pattern, ...] = tuple(re.compile(p, _RE_FLAGS) for p in LOCAL_PATTERNS)
 
 
 def classify(text: str) -> str:
@@ -80,30 +159,35 @@ def classify(text: str) -> str:
     Returns:
         "local" or "cloud"
     """
-    text = text.strip()
+    # Patterns are case-insensitive, so normalizing first lets repeated
+    # utterances ("stop", "what time is it") hit the cache
+    return _classify_normalized(text.strip().lower())
+
+
+@lru_cache(maxsize=512)
+def _classify_normalized(text: str) -> str:
+    """classify() on stripped, lowercased text. Pure, so safe to cache."""
     if not text:
         return "local"
 
-    word_count = len(text.split())
+    # Spaces + 1 approximates the word count without allocating a list; the
+    # thresholds are coarse enough that doubled spaces don't matter
+    word_count = text.count(" ") + 1
+
+    # Each list is only scanned when its answer can still change the result,
+    # and each scan stops at its first hit
 
     # Very short queries almost always belong local
     if word_count <= 5:
         # Unless they match a cloud pattern
-        for pattern in _cloud_re:
-            if pattern.search(text):
-                return "cloud"
-        return "local"
+        return "cloud" if _has_cloud_signal(text) else "local"
 
     # Check for explicit local patterns first
-    for pattern in _local_re:
-        if pattern.search(text):
-            return "local"
-
-    # Check for cloud patterns
-    cloud_signals = sum(1 for p in _cloud_re if p.search(text))
+    if _has_local_signal(text):
+        return "local"
 
     # Any cloud signal without a competing local signal → cloud
-    if cloud_signals >= 1:
+    if _has_cloud_signal(text):
         return "cloud"
 
     # Long queries with no strong signal lean cloud
@@ -136,6 +220,13 @@ class QueryRouter:
         self._local_fn = local_fn
         self._cloud_fn = cloud_fn
 
+        # Fixed modes never classify, so bind route() to a specialized
+        # method up front instead of re-checking the mode on every query
+        if mode == "local":
+            self.route = self._route_local
+        elif mode == "cloud":
+            self.route = self._route_cloud
+
     def route(self, text: str) -> Generator[str, None, None]:
         """
         Route a query to the appropriate backend and stream the response.
@@ -143,14 +234,22 @@ class QueryRouter:
         Yields:
             Response text chunks from the selected backend.
         """
-        backend = self._decide(text)
-
-        if backend == "cloud" and self._cloud_fn is not None:
+        if self._cloud_fn is not None and classify(text) == "cloud":
             yield from self._cloud_fn(text)
         else:
             # Fallback to local if cloud is unavailable
             yield from self._local_fn(text)
 
+    def _route_local(self, text: str) -> Generator[str, None, None]:
+        """route() for mode="local": the local backend's stream, unwrapped."""
+        return self._local_fn(text)
+
+    def _route_cloud(self, text: str) -> Generator[str, None, None]:
+        """route() for mode="cloud", falling back to local if cloud is unavailable."""
+        if self._cloud_fn is None:
+            return self._local_fn(text)
+        return self._cloud_fn(text)
+
     def _decide(self, text: str) -> str:
         """Decide which backend to use."""
         if self.mode == "local":
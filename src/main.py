@@ -14,7 +14,8 @@ Requirements:
     - Microphone and speakers
 
 Phase 1 Features:
-    - Speech-to-text (faster-whisper)
+    - Speech-to-text (faster-whisper distil-large-v3; --stt-model
+      distil-small.en trades accuracy for lower latency)
     - Local LLM (Qwen3 8B via Ollama)
     - Text-to-speech (Kokoro-82M)
     - Simple silence-based end-of-speech detection
@@ -27,121 +28,47 @@ Phase 3 Features:
     - Silero VAD for silence detection (replaces RMS energy)
     - Hybrid routing (local + cloud LLM)
     - --no-vad flag for RMS fallback
+    - Streaming STT: segments transcribed while still recording
+      (--no-stream-stt to transcribe after the utterance ends)
 """
 
 import argparse
-import subprocess
+import json
 import sys
-from pathlib import Path
-
-# Jett models need ~6.8 GB to load fully on GPU.
-# If less is free, the LLM gets partially offloaded to CPU → 5-10x slower.
-VRAM_REQUIRED_MB = 6800
-VRAM_WARNING_MB = 7200
-
-GPU_HEAVY_PROCESSES = {
-    "chrome.exe": "Google Chrome (disable HW acceleration or close)",
-    "firefox.exe": "Firefox (disable HW acceleration or close)",
-    "msedge.exe": "Microsoft Edge (disable HW acceleration or close)",
-    "discord.exe": "Discord (disable HW acceleration or close)",
-    "obs64.exe": "OBS Studio",
-    "nvidia broadcast.exe": "NVIDIA Broadcast",
-    "wallpaper64.exe": "Wallpaper Engine",
-    "steamwebhelper.exe": "Steam overlay",
-}
-
-
-def check_vram(verbose: bool = False) -> tuple[bool, int]:
+import urllib.error
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from src.system.vram import check_vram
+
+
+OLLAMA_TAGS_URL = "http://localhost:11434/api/tags"
+
+
+def fetch_ollama_models() -> list[str]:
     """
-    Check if there's enough free VRAM to run Jett fully on GPU.
+    Fetch the names of the models available in Ollama.
 
-    Returns:
-        (ok, free_mb)
+    Raises:
+        urllib.error.URLError: If Ollama is not reachable.
     """
-    try:
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=memory.used,memory.total,memory.free",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            print("Warning: nvidia-smi failed, skipping VRAM check")
-            return True, 0
-
-        parts = result.stdout.strip().split(",")
-        used_mb = int(parts[0].strip())
-        total_mb = int(parts[1].strip())
-        free_mb = int(parts[2].strip())
-    except FileNotFoundError:
-        print("Warning: nvidia-smi not found, skipping VRAM check")
-        return True, 0
-
-    # Get GPU processes
-    processes = []
-    try:
-        result = subprocess.run(
-            ["nvidia-smi", "--query-compute-apps=pid,name", "--format=csv,noheader"],
-            capture_output=True, text=True, timeout=10,
-        )
-        seen_pids = set()
-        for line in result.stdout.strip().split("\n"):
-            if line.strip() and "Insufficient Permissions" not in line:
-                parts = line.split(",", 1)
-                if len(parts) == 2:
-                    pid = parts[0].strip()
-                    if pid not in seen_pids:
-                        seen_pids.add(pid)
-                        processes.append({"pid": pid, "name": parts[1].strip()})
-    except Exception:
-        pass
+    # stdlib urllib: avoids paying the `requests` import on startup
+    with urllib.request.urlopen(OLLAMA_TAGS_URL, timeout=5) as resp:
+        models = json.load(resp).get("models", [])
+    return [m.get("name", "") for m in models]
 
-    print(f"  GPU: {used_mb} MB used / {total_mb} MB total ({free_mb} MB free)")
-
-    # Find heavy processes
-    heavy = []
-    for proc in processes:
-        exe = Path(proc["name"]).name.lower()
-        for pattern, desc in GPU_HEAVY_PROCESSES.items():
-            if pattern in exe:
-                heavy.append(desc)
-
-    if verbose and processes:
-        print(f"  GPU processes ({len(processes)}):")
-        for proc in processes:
-            print(f"    PID {proc['pid']:>6}  {Path(proc['name']).name}")
-
-    if heavy:
-        print(f"  GPU-heavy apps: {', '.join(sorted(set(heavy)))}")
-
-    if free_mb >= VRAM_WARNING_MB:
-        print(f"  VRAM: OK")
-        return True, free_mb
-    elif free_mb >= VRAM_REQUIRED_MB:
-        print(f"  VRAM: OK (tight — {free_mb} MB free)")
-        return True, free_mb
-    else:
-        deficit = VRAM_REQUIRED_MB - free_mb
-        print(f"  VRAM: INSUFFICIENT ({free_mb} MB free < {VRAM_REQUIRED_MB} MB needed)")
-        print(f"  Close GPU-heavy apps to free ~{deficit} MB, or use --force to start anyway.")
-        if heavy:
-            for desc in sorted(set(heavy)):
-                print(f"    - {desc}")
-        return False, free_mb
-
-
-def check_ollama() -> bool:
-    """Check if Ollama is running and jett-qwen3 is available."""
-    import requests
 
+def check_ollama(pending: Optional[Future] = None) -> bool:
+    """
+    Check if Ollama is running and jett-qwen3 is available.
+
+    Args:
+        pending: In-flight fetch_ollama_models() future to use instead of
+            querying Ollama again.
+    """
     try:
-        resp = requests.get("http://localhost:11434/api/tags", timeout=5)
-        models = resp.json().get("models", [])
-        model_names = [m.get("name", "") for m in models]
+        model_names = pending.result() if pending is not None else fetch_ollama_models()
 
         if not any("jett-qwen3" in name for name in model_names):
             print("Error: jett-qwen3 model not found in Ollama.")
@@ -150,7 +77,7 @@ def check_ollama() -> bool:
 
         return True
 
-    except requests.exceptions.ConnectionError:
+    except (urllib.error.URLError, ConnectionError):
         print("Error: Ollama is not running.")
         print("Start Ollama first: ollama serve")
         return False
@@ -188,14 +115,29 @@ def main():
         help="Seconds of silence to end recording (default: 1.0)"
     )
     parser.add_argument(
-        "--no-vad",
-        action="store_true",
-        help="Disable Silero VAD, use RMS energy silence detection instead"
+        "--vad",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Silero VAD silence detection; --no-vad uses RMS energy instead"
     )
     parser.add_argument(
-        "--no-wake",
-        action="store_true",
-        help="Disable wake word detection (always listening)"
+        "--wake",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Wake word detection; --no-wake is always listening"
+    )
+    parser.add_argument(
+        "--stream-stt",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Transcribe speech segments while still recording; "
+             "--no-stream-stt transcribes the whole utterance after it ends"
+    )
+    parser.add_argument(
+        "--stt-model",
+        default="distil-large-v3",
+        help="faster-whisper model (default: distil-large-v3; "
+             "distil-small.en is faster but less accurate)"
     )
     parser.add_argument(
         "--wake-debug",
@@ -221,6 +163,10 @@ def main():
     print("=" * 40)
     print()
 
+    # The Ollama probe is independent network I/O — start it now so it
+    # overlaps the GPU query instead of running after it
+    ollama_models = ThreadPoolExecutor(max_workers=1).submit(fetch_ollama_models)
+
     # Check VRAM
     print("Checking GPU...")
     vram_ok, free_mb = check_vram(verbose=args.debug)
@@ -230,31 +176,46 @@ def main():
         print("  --force: Starting despite low VRAM (LLM may be slow)")
     print()
 
+    # If the probe is still in flight, spend the wait on the pipeline import
+    # (torch / faster-whisper / kokoro) rather than blocking on the socket
+    if not ollama_models.done():
+        from src.voice.pipeline import VoicePipeline
+
     # Check Ollama
     print("Checking Ollama...")
-    if not check_ollama():
+    if not check_ollama(ollama_models):
         sys.exit(1)
     print("Ollama OK")
     print()
 
-    # Import and run pipeline
+    # Cloud routing: import the Anthropic SDK while local models load
+    if args.router_mode != "local":
+        from src.llm.cloud import warm_import
+        warm_import()
+
+    # Load .env for API keys (only cloud routing needs them)
+    if args.router_mode != "local":
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            pass
+
+    # Import and run pipeline — deferred so --help and failed checks
+    # don't pay for torch / faster-whisper / kokoro imports (a no-op if
+    # it already ran while waiting on Ollama)
     from src.voice.pipeline import VoicePipeline
 
-    # Load .env for API keys
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        pass
-
-    use_vad = not args.no_vad
+    use_vad = args.vad
     pipeline = VoicePipeline(
         debug=args.debug,
-        use_wake_word=not args.no_wake,
+        stt_model=args.stt_model,
+        use_wake_word=args.wake,
         wake_debug=args.wake_debug,
         router_mode=args.router_mode,
         cloud_model=args.cloud_model,
         use_vad=use_vad,
+        stream_stt=args.stream_stt,
     )
 
     # Auto-set silence threshold based on detection mode
@@ -34,6 +34,15 @@ BLOCKED_ACTIONS: frozenset[str] = frozenset([
 ])
 
 
+# Every permitted (action, container) pair. Blocked actions are removed
+# even if they were ever added to ALLOWED_ACTIONS — block always wins.
+_ALLOWED_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (action, container)
+    for action in ALLOWED_ACTIONS - BLOCKED_ACTIONS
+    for container in ALLOWED_CONTAINERS
+)
+
+
 def is_allowed(action: str, container: str) -> bool:
-    """Check if an action on a container is permitted."""
-    return action in ALLOWED_ACTIONS and container in ALLOWED_CONTAINERS
+    """Check if an action on a container is permitted (single set lookup)."""
+    return (action, container) in _ALLOWED_PAIRS
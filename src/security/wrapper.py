@@ -11,13 +11,24 @@ Usage:
     result = controller.execute("restart", "n8n")
 """
 
+import json
+import threading
 import time
+from collections import deque
 from pathlib import Path
 
 from src.security.allowlist import ALLOWED_ACTIONS, ALLOWED_CONTAINERS
-from src.security.audit import AuditLogger
+from src.security.audit import AuditLogger, redact_secrets
 from src.security.exceptions import AllowlistError, RateLimitError
 
+# Rate-limit window, in monotonic_ns() units
+RATE_WINDOW_NS = 60_000_000_000
+
+# Allowlists are frozensets, so their sorted listings for denial messages
+# can be built once here instead of on every denial
+_ALLOWED_ACTIONS_STR = str(sorted(ALLOWED_ACTIONS))
+_ALLOWED_CONTAINERS_STR = str(sorted(ALLOWED_CONTAINERS))
+
 
 class ContainerController:
     """
@@ -27,7 +38,8 @@ class ContainerController:
     1. Action allowlist check
     2. Container allowlist check
     3. Rate limit check
-    4. Audit logging (before and after)
+    4. Audit logging (before and after) — the ATTEMPT entry is flushed to
+       disk before execution, so nothing runs without a durable record
     5. Execution (Portainer API or dev_mode stub)
     """
 
@@ -46,7 +58,10 @@ class ContainerController:
         self.dev_mode = dev_mode
         self.rate_limit = rate_limit
         self.audit = AuditLogger(log_dir=audit_dir)
-        self._operation_times: list[float] = []
+        # time.monotonic_ns() of recent operations, oldest first
+        self._operation_times: deque[int] = deque(maxlen=rate_limit)
+        # Check-and-reserve is atomic, so concurrent calls can't all pass
+        self._rate_lock = threading.Lock()
 
     def execute(self, action: str, container: str, **kwargs) -> dict:
         """
@@ -62,31 +77,48 @@ class ContainerController:
         Raises:
             AllowlistError: If action or container is not permitted.
             RateLimitError: If rate limit is exceeded.
+            AuditError: If the ATTEMPT entry could not be written.
         """
-        params = {"action": action, "container": container, **kwargs}
+        # Serialize (C json encoder) + redact once; every entry below reuses
+        # the result. JSON keeps audit lines parseable downstream.
+        params = redact_secrets(json.dumps(
+            {"action": action, "container": container, **kwargs},
+            separators=(",", ":"),
+            default=str,
+        ))
 
         # Log intent
-        self.audit.log("ATTEMPT", "execute", str(params))
+        self.audit.log("ATTEMPT", "execute", params, pre_redacted=True)
 
         try:
             # Validate
             self._validate_action(action)
             self._validate_container(container)
-            self._check_rate_limit()
+            slot = self._check_rate_limit()
 
-            # Execute
-            result = self._execute_portainer(action, container, **kwargs)
+            try:
+                # The ATTEMPT entry must be on disk (or AuditError raised)
+                # before anything privileged happens
+                self.audit.flush()
+
+                # Execute
+                result = self._execute_portainer(action, container, **kwargs)
+            except Exception:
+                # Only completed operations use up quota, so a burst of
+                # failing calls can't lock out legitimate ones
+                self._release_slot(slot)
+                raise
 
             # Log success
-            self.audit.log("SUCCESS", "execute", str(params))
+            self.audit.log("SUCCESS", "execute", params, pre_redacted=True)
             return result
 
         except (AllowlistError, RateLimitError) as e:
-            self.audit.log("DENIED", "execute", str(params), error=str(e))
+            self.audit.log("DENIED", "execute", params, error=str(e), pre_redacted=True)
             raise
 
         except Exception as e:
-            self.audit.log("ERROR", "execute", str(params), error=str(e))
+            self.audit.log("ERROR", "execute", params, error=str(e), pre_redacted=True)
             raise
 
     def _validate_action(self, action: str) -> None:
@@ -94,7 +126,7 @@ class ContainerController:
         if action not in ALLOWED_ACTIONS:
             raise AllowlistError(
                 f"Action '{action}' not in allowlist. "
-                f"Allowed: {sorted(ALLOWED_ACTIONS)}"
+                f"Allowed: {_ALLOWED_ACTIONS_STR}"
             )
 
     def _validate_container(self, container: str) -> None:
@@ -102,25 +134,47 @@ class ContainerController:
         if container not in ALLOWED_CONTAINERS:
             raise AllowlistError(
                 f"Container '{container}' not in allowlist. "
-                f"Allowed: {sorted(ALLOWED_CONTAINERS)}"
+                f"Allowed: {_ALLOWED_CONTAINERS_STR}"
             )
 
-    def _check_rate_limit(self) -> None:
-        """Enforce sliding-window rate limit (operations per minute)."""
-        now = time.time()
-
-        # Prune operations older than 60 seconds
-        self._operation_times = [
-            t for t in self._operation_times if now - t < 60
-        ]
+    def _check_rate_limit(self) -> int:
+        """
+        Enforce sliding-window rate limit (operations per minute).
 
-        if len(self._operation_times) >= self.rate_limit:
-            raise RateLimitError(
-                f"Rate limit exceeded: {self.rate_limit} operations/minute. "
-                f"Try again in {60 - (now - self._operation_times[0]):.0f}s."
-            )
+        Checks and reserves a slot in one step under a lock, so in-flight
+        operations count against the limit. Hand the result to
+        _release_slot() if the operation fails.
 
-        self._operation_times.append(now)
+        Returns:
+            The reserved slot's timestamp.
+        """
+        with self._rate_lock:
+            # Integer monotonic ns: wall-clock jumps (NTP, DST) can't reset or
+            # stall the window, and comparisons stay in int arithmetic
+            now = time.monotonic_ns()
+            times = self._operation_times
+
+            # Prune operations older than 60 seconds (oldest are on the left)
+            while times and now - times[0] >= RATE_WINDOW_NS:
+                times.popleft()
+
+            if len(times) >= self.rate_limit:
+                wait_s = -(-(RATE_WINDOW_NS - (now - times[0])) // 1_000_000_000)  # Ceiling
+                raise RateLimitError(
+                    f"Rate limit exceeded: {self.rate_limit} operations/minute. "
+                    f"Try again in {wait_s}s."
+                )
+
+            times.append(now)
+            return now
+
+    def _release_slot(self, slot: int) -> None:
+        """Give back a slot reserved by _check_rate_limit() for a failed operation."""
+        with self._rate_lock:
+            try:
+                self._operation_times.remove(slot)
+            except ValueError:
+                pass  # Already aged out of the window
 
     def _execute_portainer(self, action: str, container: str, **kwargs) -> dict:
         """
@@ -0,0 +1 @@
+"""System checks — GPU/VRAM availability for startup."""
@@ -0,0 +1,248 @@
+"""
+VRAM availability check shared by the Jett entry points.
+
+Jett's models need ~6.8 GB of VRAM to load fully on GPU. If less is free,
+the LLM gets partially offloaded to CPU and responses become 5-10x slower,
+so startup checks free memory and flags known GPU-heavy apps.
+
+GPU state is read through NVML (pynvml) when available — a library call —
+and falls back to parsing nvidia-smi output otherwise.
+
+Usage:
+    from src.system.vram import check_vram
+
+    ok, free_mb = check_vram(verbose=True)
+"""
+
+import re
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Optional
+
+# Jett models need ~6.8 GB to load fully on GPU.
+# If less is free, the LLM gets partially offloaded to CPU → 5-10x slower.
+VRAM_REQUIRED_MB = 6800
+VRAM_WARNING_MB = 7200  # Warn if headroom is slim
+
+# Known GPU-heavy processes to flag (lowercase exe names, read-only)
+GPU_HEAVY_PROCESSES = MappingProxyType({
+    "chrome.exe": "Google Chrome (disable HW acceleration or close)",
+    "firefox.exe": "Firefox (disable HW acceleration or close)",
+    "msedge.exe": "Microsoft Edge (disable HW acceleration or close)",
+    "discord.exe": "Discord (disable HW acceleration or close)",
+    "obs64.exe": "OBS Studio",
+    "nvidia broadcast.exe": "NVIDIA Broadcast",
+    "wallpaper64.exe": "Wallpaper Engine",
+    "steamwebhelper.exe": "Steam overlay",
+})
+
+# All patterns as one alternation: a single scan per exe name instead of
+# a substring test per pattern
+_HEAVY_RE = re.compile("|".join(re.escape(p) for p in GPU_HEAVY_PROCESSES))
+
+# Back-to-back checks within this window reuse one GPU reading
+SNAPSHOT_TTL_S = 2.0
+
+
+@dataclass
+class GpuSnapshot:
+    """GPU memory (MB) and compute processes at one point in time."""
+    used_mb: int
+    total_mb: int
+    free_mb: int
+    processes: list[dict] = field(default_factory=list)
+
+
+# (monotonic time, snapshot) of the last reading, for cached_gpu_snapshot()
+_snapshot_cache: Optional[tuple[float, Optional[GpuSnapshot]]] = None
+
+
+def _nvml_snapshot() -> Optional[GpuSnapshot]:
+    """
+    Query GPU memory and processes in-process via NVML (pynvml).
+
+    Returns:
+        GpuSnapshot, or None if pynvml or the NVML library is unavailable.
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
+
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+
+    try:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+
+        # Keyed by pid: a process can be listed more than once
+        names = {}
+        try:
+            for proc in pynvml.nvmlDeviceGetComputeRunningProcesses(handle):
+                if proc.pid in names:
+                    continue
+                try:
+                    name = pynvml.nvmlSystemGetProcessName(proc.pid)
+                except pynvml.NVMLError:
+                    continue  # Insufficient permissions
+                if isinstance(name, bytes):
+                    name = name.decode(errors="replace")
+                names[proc.pid] = name
+        except pynvml.NVMLError:
+            pass
+
+        processes = [{"pid": str(pid), "name": name} for pid, name in names.items()]
+        return GpuSnapshot(mem.used >> 20, mem.total >> 20, mem.free >> 20, processes)
+    finally:
+        pynvml.nvmlShutdown()
+
+
+def _smi_mb(text: Optional[str]) -> int:
+    """Parse an nvidia-smi XML memory value like "8192 MiB"."""
+    return int(text.split()[0])
+
+
+def _smi_snapshot() -> Optional[GpuSnapshot]:
+    """
+    Query GPU memory and processes by running nvidia-smi (fallback path).
+
+    A single `nvidia-smi -q -x` call returns memory and the process list
+    together as XML, so only one process is spawned.
+
+    Returns:
+        GpuSnapshot, or None if nvidia-smi is missing or fails.
+    """
+    try:
+        result = subprocess.run(
+            ["nvidia-smi", "-q", "-x"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except FileNotFoundError:
+        print("Warning: nvidia-smi not found")
+        return None
+
+    if result.returncode != 0:
+        print(f"Warning: nvidia-smi failed: {result.stderr.strip()}")
+        return None
+
+    try:
+        gpu = ET.fromstring(result.stdout).find("gpu")
+        mem = gpu.find("fb_memory_usage")
+        used_mb = _smi_mb(mem.findtext("used"))
+        total_mb = _smi_mb(mem.findtext("total"))
+        free_mb = _smi_mb(mem.findtext("free"))
+    except (ET.ParseError, AttributeError, ValueError, IndexError):
+        print("Warning: could not parse nvidia-smi output")
+        return None
+
+    # Keyed by pid: a process can be listed more than once (first entry wins)
+    names = {}
+    for info in gpu.iterfind("processes/process_info"):
+        pid = (info.findtext("pid") or "").strip()
+        name = (info.findtext("process_name") or "").strip()
+        if pid and name:
+            names.setdefault(pid, name)
+    processes = [{"pid": pid, "name": name} for pid, name in names.items()]
+
+    return GpuSnapshot(used_mb, total_mb, free_mb, processes)
+
+
+def gpu_snapshot() -> Optional[GpuSnapshot]:
+    """
+    Read current GPU memory and compute processes.
+
+    Returns:
+        GpuSnapshot, or None if neither NVML nor nvidia-smi is usable.
+    """
+    # NVML is a library call; nvidia-smi costs a fork+exec and CSV parse
+    return _nvml_snapshot() or _smi_snapshot()
+
+
+def cached_gpu_snapshot() -> Optional[GpuSnapshot]:
+    """gpu_snapshot(), reusing a reading taken within the last SNAPSHOT_TTL_S seconds."""
+    global _snapshot_cache
+    now = time.monotonic()
+    if _snapshot_cache is not None and now - _snapshot_cache[0] < SNAPSHOT_TTL_S:
+        return _snapshot_cache[1]
+    snapshot = gpu_snapshot()
+    _snapshot_cache = (now, snapshot)
+    return snapshot
+
+
+def invalidate_vram_cache() -> None:
+    """Drop the cached GPU reading so the next check queries the GPU again."""
+    global _snapshot_cache
+    _snapshot_cache = None
+
+
+def exe_basename(path: str) -> str:
+    """Exe name from a Windows or POSIX path (cheaper than building a Path)."""
+    return path[max(path.rfind("\\"), path.rfind("/")) + 1:]
+
+
+def find_heavy_processes(processes: list[dict]) -> list[str]:
+    """
+    Match GPU processes against GPU_HEAVY_PROCESSES.
+
+    Returns:
+        Sorted, de-duplicated descriptions of the heavy apps found.
+    """
+    heavy = set()
+    for proc in processes:
+        exe_name = exe_basename(proc["name"]).lower()
+        for match in _HEAVY_RE.finditer(exe_name):
+            heavy.add(GPU_HEAVY_PROCESSES[match.group()])
+    return sorted(heavy)
+
+
+def check_vram(verbose: bool = False) -> tuple[bool, int]:
+    """
+    Check if there's enough free VRAM to run Jett fully on GPU.
+
+    The GPU reading is reused for SNAPSHOT_TTL_S seconds; call
+    invalidate_vram_cache() to force a fresh one (e.g. after the user
+    closes an app).
+
+    Returns:
+        (ok, free_mb). If the GPU can't be queried the check is skipped
+        and (True, 0) is returned.
+    """
+    snapshot = cached_gpu_snapshot()
+    if snapshot is None:
+        print("Warning: could not query GPU, skipping VRAM check")
+        return True, 0
+
+    free_mb = snapshot.free_mb
+    print(f"  GPU: {snapshot.used_mb} MB used / {snapshot.total_mb} MB total ({free_mb} MB free)")
+
+    heavy = find_heavy_processes(snapshot.processes)
+
+    if verbose and snapshot.processes:
+        print(f"  GPU processes ({len(snapshot.processes)}):")
+        for proc in snapshot.processes:
+            print(f"    PID {proc['pid']:>6}  {exe_basename(proc['name'])}")
+
+    if heavy:
+        print(f"  GPU-heavy apps: {', '.join(heavy)}")
+
+    if free_mb >= VRAM_WARNING_MB:
+        print("  VRAM: OK")
+        return True, free_mb
+    elif free_mb >= VRAM_REQUIRED_MB:
+        print(f"  VRAM: OK (tight — {free_mb} MB free)")
+        return True, free_mb
+    else:
+        deficit = VRAM_REQUIRED_MB - free_mb
+        print(f"  VRAM: INSUFFICIENT ({free_mb} MB free < {VRAM_REQUIRED_MB} MB needed)")
+        print(f"  Close GPU-heavy apps to free ~{deficit} MB, or use --force to start anyway.")
+        for desc in heavy:
+            print(f"    - {desc}")
+        return False, free_mb
@@ -1,7 +1,27 @@
 # Voice pipeline modules
-from src.voice.stt import STT
-from src.voice.tts import TTS
-from src.voice.pipeline import VoicePipeline
-from src.voice.wake_word import WakeWordDetector
+#
+# Loaded lazily (PEP 562): importing one submodule, e.g. src.voice.wake_word,
+# doesn't drag in torch / faster-whisper / kokoro through this package.
+import importlib
 
-__all__ = ["STT", "TTS", "VoicePipeline", "WakeWordDetector"]
+__all__ = ["AudioHub", "STT", "TTS", "VoicePipeline", "WakeWordDetector"]
+
+_SUBMODULES = {
+    "AudioHub": "audio_hub",
+    "STT": "stt",
+    "TTS": "tts",
+    "VoicePipeline": "pipeline",
+    "WakeWordDetector": "wake_word",
+}
+
+
+def __getattr__(name: str):
+    if name not in _SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{_SUBMODULES[name]}"), name)
+    globals()[name] = value  # Cache: later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
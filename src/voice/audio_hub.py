@@ -0,0 +1,211 @@
+"""
+Jett Audio Hub — one shared microphone stream
+
+Opens a single 16kHz mono PortAudio input stream and fans each block out
+to every consumer, so the wake word detector and the pipeline recorder
+don't each hold their own stream (and driver-side buffer and resampler)
+on the same device.
+
+The stream captures int16, the device's usual native format and what
+openWakeWord consumes, so the wake word path never converts samples.
+Consumers either subscribe a callback, which runs on the audio thread
+with each int16 block (a view valid only during the call), or open an
+AudioReader for RawInputStream-style blocking reads of float32 [-1, 1]
+samples in any block size. The stream starts with the first consumer and
+closes when the last one leaves.
+
+Usage:
+    from src.voice.audio_hub import AudioHub
+
+    hub = AudioHub.instance()
+    hub.subscribe(on_block)          # on_block(audio_int16) per 1280 samples
+    reader = hub.open_reader()
+    audio, overflowed = reader.read(512)
+    reader.close()
+    hub.unsubscribe(on_block)
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Optional
+
+import numpy as np
+import sounddevice as sd
+
+
+class AudioReader:
+    """
+    Blocking reader over the shared stream, like sd.RawInputStream.read().
+
+    int16 blocks are copied into a bounded queue on the audio thread and
+    scaled to float32 by read(); when the consumer falls behind by more than
+    max_seconds the oldest audio is dropped and the next read() reports an
+    overflow.
+    """
+
+    # read() waits in slices this long (an untimed wait can't be interrupted
+    # by Ctrl+C on Windows), and gives up once no audio has arrived for
+    # STALL_SECONDS — blocks normally arrive every 80ms
+    POLL_SECONDS = 0.5
+    STALL_SECONDS = 2.0
+
+    def __init__(self, hub: "AudioHub", max_seconds: float = 5.0):
+        self._hub = hub
+        self._capacity = int(max_seconds * hub.SAMPLE_RATE)
+        self._blocks: deque[np.ndarray] = deque()
+        self._available = 0
+        self._overflowed = False
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _on_audio(self, audio: np.ndarray) -> None:
+        """Hub callback: queue a copy of the block (indata is reused)."""
+        block = audio.copy()
+        with self._cond:
+            self._blocks.append(block)
+            self._available += len(block)
+            while self._available > self._capacity:
+                self._available -= len(self._blocks.popleft())
+                self._overflowed = True
+            self._cond.notify()
+
+    @property
+    def read_available(self) -> int:
+        """Samples that can be read without blocking."""
+        return self._available
+
+    def read(self, frames: int) -> tuple[np.ndarray, bool]:
+        """
+        Read exactly `frames` samples, blocking until they arrive.
+
+        Returns:
+            (float32 samples in [-1, 1], overflowed) — overflowed is True
+            if audio was dropped since the previous read.
+
+        Raises:
+            RuntimeError: If the reader is closed while waiting, or the
+                microphone stream stops or stalls.
+        """
+        with self._cond:
+            last_available = self._available
+            last_progress = time.monotonic()
+            while self._available < frames:
+                if self._closed:
+                    raise RuntimeError("Audio reader is closed")
+                if not self._hub.is_active():
+                    raise RuntimeError("Microphone stream is not running")
+                self._cond.wait(timeout=self.POLL_SECONDS)
+                now = time.monotonic()
+                if self._available != last_available:
+                    last_available, last_progress = self._available, now
+                elif now - last_progress >= self.STALL_SECONDS:
+                    raise RuntimeError(
+                        f"No microphone audio for {self.STALL_SECONDS:.0f}s "
+                        "(device disconnected?)"
+                    )
+
+            out = np.empty(frames, dtype=np.float32)
+            filled = 0
+            while filled < frames:
+                block = self._blocks[0]
+                take = min(len(block), frames - filled)
+                out[filled:filled + take] = block[:take]
+                filled += take
+                if take == len(block):
+                    self._blocks.popleft()
+                else:
+                    self._blocks[0] = block[take:]
+            self._available -= frames
+            out *= 1 / 32768  # Same scaling PortAudio uses for int16 → float32
+
+            overflowed, self._overflowed = self._overflowed, False
+        return out, overflowed
+
+    def close(self) -> None:
+        """Detach from the hub; a blocked read() raises RuntimeError."""
+        self._hub.unsubscribe(self._on_audio)
+        with self._cond:
+            self._closed = True
+            self._blocks.clear()
+            self._available = 0
+            self._cond.notify_all()
+
+    def __enter__(self) -> "AudioReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AudioHub:
+    """Owns the shared input stream and dispatches blocks to subscribers."""
+
+    # openWakeWord's chunk size; readers re-block to whatever they need
+    SAMPLE_RATE = 16000
+    CHANNELS = 1
+    BLOCK_SIZE = 1280
+
+    _instance: Optional["AudioHub"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "AudioHub":
+        """Process-wide hub (there is one microphone)."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self):
+        # Replaced, never mutated: the audio thread iterates it without a lock
+        self._subscribers: tuple[Callable[[np.ndarray], None], ...] = ()
+        self._stream: Optional[sd.InputStream] = None
+        self._lock = threading.Lock()
+
+    def _callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
+        audio = indata[:, 0]  # mono
+        for subscriber in self._subscribers:
+            subscriber(audio)
+
+    def is_active(self) -> bool:
+        """True while the input stream is open and running."""
+        stream = self._stream
+        return stream is not None and stream.active
+
+    def subscribe(self, callback: Callable[[np.ndarray], None]) -> None:
+        """
+        Deliver every block to callback, starting the stream if needed.
+
+        Args:
+            callback: Called on the audio thread with an int16 block. The
+                array is only valid during the call; copy it to keep it.
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                return
+            self._subscribers += (callback,)
+            if self._stream is None:
+                self._stream = sd.InputStream(
+                    samplerate=self.SAMPLE_RATE,
+                    channels=self.CHANNELS,
+                    blocksize=self.BLOCK_SIZE,
+                    dtype="int16",
+                    callback=self._callback,
+                )
+                self._stream.start()
+
+    def unsubscribe(self, callback: Callable[[np.ndarray], None]) -> None:
+        """Stop delivering blocks to callback; closes the stream after the last one."""
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s != callback)
+            if not self._subscribers and self._stream is not None:
+                self._stream.stop()
+                self._stream.close()
+                self._stream = None
+
+    def open_reader(self, max_seconds: float = 5.0) -> AudioReader:
+        """Subscribe a new blocking AudioReader (close() it when done)."""
+        reader = AudioReader(self, max_seconds)
+        self.subscribe(reader._on_audio)
+        return reader
@@ -4,7 +4,7 @@ Jett Voice Pipeline - End-to-End STT → LLM → TTS
 This module wires together the complete voice interaction loop:
 1. Listen for audio from microphone
 2. Detect end of speech (simple silence detection)
-3. Transcribe with faster-whisper
+3. Transcribe with faster-whisper (segments transcribed during recording)
 4. Generate response with Ollama (jett-qwen3)
 5. Synthesize and play audio with Kokoro
 
@@ -17,27 +17,36 @@ Usage:
 
 import io
 import json
+import math
 import os
 import queue
 import re
 import sys
-import tempfile
 import threading
 import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Callable, Generator, Optional
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import sounddevice as sd
 import soundfile as sf
 import torch
 
+from src.voice.audio_hub import AudioHub, AudioReader
+
 # Suppress warnings
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
+# Sentence boundaries for streaming TTS
+_SENT_END_RE = re.compile(r'[.!?]\s*$')
+_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 
 class PipelineState(Enum):
     """State machine for voice pipeline to prevent feedback loops."""
@@ -63,6 +72,72 @@ class PipelineMetrics:
     llm_backend: str = "local"
 
 
+# Numeric PipelineMetrics fields kept per turn for session statistics
+_TIMING_FIELDS = (
+    "stt_ms",
+    "llm_first_token_ms",
+    "llm_total_ms",
+    "tts_first_audio_ms",
+    "tts_total_ms",
+    "playback_ms",
+    "e2e_ms",
+)
+_E2E_COL = _TIMING_FIELDS.index("e2e_ms")
+
+
+class _StreamingTranscriber:
+    """
+    Transcribes an utterance segment by segment while recording continues.
+
+    record_audio() hands over each speech segment as soon as a pause closes
+    it, so when end-of-speech fires only the last segment is left to
+    transcribe.
+    """
+
+    def __init__(self, stt):
+        self._stt = stt
+        self._segments: queue.Queue = queue.Queue()
+        self._texts: list[str] = []
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def add_segment(self, audio: np.ndarray) -> None:
+        """Queue a closed speech segment (16kHz mono float32) for transcription."""
+        self._segments.put(np.ascontiguousarray(audio, dtype=np.float32))
+
+    def result(self) -> str:
+        """Wait for queued segments to finish and return the joined transcript."""
+        self._segments.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return " ".join(self._texts)
+
+    def cancel(self) -> None:
+        """Stop after the segment in progress; the transcript is discarded."""
+        self._segments.put(None)
+
+    def _run(self) -> None:
+        while True:
+            audio = self._segments.get()
+            if audio is None:
+                return
+            if self._error is not None:
+                continue
+            try:
+                # Earlier segments as the prompt keep wording consistent across cuts
+                text, _ = self._stt.transcribe(
+                    audio, initial_prompt=" ".join(self._texts) or None
+                )
+            except Exception as e:
+                self._error = e
+                continue
+            text = text.strip()
+            if text:
+                self._texts.append(text)
+
+
 class VoicePipeline:
     """
     End-to-end voice assistant pipeline.
@@ -80,9 +155,25 @@ class VoicePipeline:
     SILENCE_DURATION = 0.5     # Seconds of silence to end recording
     MAX_RECORD_SECONDS = 30    # Maximum recording length
 
+    # Streaming STT: a pause this long closes a segment for early transcription,
+    # and a segment is cut regardless once it gets this long
+    SEGMENT_PAUSE = 0.25
+    MAX_SEGMENT_SECONDS = 8
+
+    # Smoothing for the RMS-mode block power average (weight of the newest block)
+    POWER_EMA_ALPHA = 0.3
+
     # TTS sample rate
     TTS_SAMPLE_RATE = 24000
 
+    # Short replies synthesized once at load and then served from memory.
+    # "I don't know" is what the jett-qwen3 system prompt asks for.
+    CANNED_PHRASES = (
+        "Okay.", "Sure.", "Done.", "Got it.", "Yes.", "No.",
+        "Hello!", "Hi!", "One moment.", "I don't know.",
+        "You're welcome.", "Sorry, I didn't catch that.",
+    )
+
     def __init__(
         self,
         ollama_url: str = "http://localhost:11434",
@@ -95,6 +186,7 @@ class VoicePipeline:
         router_mode: str = "local",
         cloud_model: str = "claude-sonnet-4-5-20250929",
         use_vad: bool = True,
+        stream_stt: bool = True,
     ):
         self.ollama_url = ollama_url
         self.model = model
@@ -106,16 +198,41 @@ class VoicePipeline:
         self.router_mode = router_mode
         self.cloud_model = cloud_model
         self.use_vad = use_vad
+        self.stream_stt = stream_stt
 
         self.stt = None
         self.tts = None
         self._running = False
-        self._audio_queue = queue.Queue()
+        # Recording lands here in place instead of a list of per-block arrays
+        self._record_buf = np.empty(
+            self.MAX_RECORD_SECONDS * self.SAMPLE_RATE, dtype=np.float32
+        )
         self._state = PipelineState.LISTENING
         self._router = None
         self._cloud_llm = None
         self._vad_model = None
 
+        # One kept-alive connection to Ollama, reused across turns
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
+        # Sentences are synthesized off the LLM thread, each worker on its
+        # own CUDA stream
+        self._tts_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jett-tts")
+        self._tts_local = threading.local()
+
+        # Persistent mic and speaker streams, opened in load_models()
+        self._input_stream = None
+        self._out_stream = None
+
+        # Pre-synthesized CANNED_PHRASES audio (int16), filled in load_models()
+        self._tts_cache: dict[str, np.ndarray] = {}
+
+        # Per-turn timings, one row per turn (columns: _TIMING_FIELDS).
+        # Text stays out of the history so long sessions hold only floats.
+        self._metrics_buf = np.empty((256, len(_TIMING_FIELDS)), dtype=np.float32)
+        self._metrics_n = 0
+
         # Wake word
         self.wake_word_detector = None
         self._wake_event = threading.Event()
@@ -127,6 +244,7 @@ class VoicePipeline:
         print("Loading wake word model...")
         self.wake_word_detector = WakeWordDetector(
             debug=self.wake_debug or self.debug,
+            quantized=True,  # Falls back to the float model if not generated
         )
         # Eagerly load the model so startup latency is paid upfront
         self.wake_word_detector._load_model()
@@ -155,34 +273,51 @@ class VoicePipeline:
         """Load STT and TTS models."""
         print("Loading models...")
 
+        # Warm up LLM (load into VRAM if not already). Ollama loads it in its
+        # own process, so start now and let it overlap the STT/TTS loads.
+        warmup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jett-llm-warmup")
+        llm_warmup = warmup_pool.submit(self._warm_llm)
+        # The submitted warm-up still runs; the worker exits once it's done,
+        # even if a load below raises before its result is collected
+        warmup_pool.shutdown(wait=False)
+
         # Load STT
         from src.voice.stt import STT
-        self.stt = STT(model_size=self.stt_model, device="cuda", compute_type="int8")
+        # "auto": int8_float16 where supported, else float16 / int8 / CPU
+        self.stt = STT(model_size=self.stt_model, device="cuda", compute_type="auto")
         self.stt.load()
+        self.stt.warmup()
 
         # Load TTS
         from src.voice.tts import TTS
-        self.tts = TTS(voice=self.tts_voice, device="cuda")
+        self.tts = TTS(voice=self.tts_voice, device="cuda", fp16=True)
         self.tts.load()
 
-        # Warm up TTS (first call is slow due to CUDA JIT)
+        # Warm up TTS (first call is slow due to CUDA JIT). A few lengths,
+        # so kernels for typical sentence shapes are selected up front.
         print("Warming up TTS...")
-        _ = self.tts.synthesize("Ready.")
+        for text in ("Ready.", "Sure, one moment.", "Here is a longer sentence to warm up with."):
+            _ = self.tts.synthesize(text)
+        for phrase in self.CANNED_PHRASES:
+            self._tts_cache[phrase] = self.tts.synthesize_int16(phrase)
+
+        # Keep one output stream open: back-to-back sentences are written
+        # into it without reopening the device between them
+        self._out_stream = sd.OutputStream(
+            samplerate=self.TTS_SAMPLE_RATE,
+            channels=1,
+            dtype="int16",  # TTS audio is queued as 16-bit PCM
+            latency="low",
+        )
+        self._out_stream.start()
+
+        # Likewise keep a reader on the mic, so a wake word doesn't wait on
+        # a device open before recording starts
+        self._input_stream = self._make_input_stream()
 
-        # Warm up LLM (load into VRAM if not already)
         print("Warming up LLM...")
         try:
-            requests.post(
-                f"{self.ollama_url}/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": "hi"}],
-                    "stream": False,
-                    "keep_alive": -1,  # Keep model loaded indefinitely
-                    "options": {"num_predict": 5}  # Limit output for warmup
-                },
-                timeout=120
-            )
+            print(f"LLM warm in {llm_warmup.result():.0f}ms")
         except Exception as e:
             print(f"LLM warmup warning: {e}")
 
@@ -195,6 +330,24 @@ class VoicePipeline:
 
         print("Models loaded and ready.")
 
+    def _warm_llm(self) -> float:
+        """Have Ollama load the model and generate one token. Returns ms taken."""
+        start = time.perf_counter()
+        response = self._http.post(
+            f"{self.ollama_url}/api/chat",
+            json={
+                "model": self.model,
+                "messages": [{"role": "user", "content": "hi"}],
+                "stream": False,
+                "keep_alive": -1,  # Keep model loaded indefinitely
+                "think": False,
+                "options": {"num_predict": 1}  # Loading is the point, not output
+            },
+            timeout=120
+        )
+        response.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
     def _init_router(self) -> None:
         """Initialize the hybrid LLM router."""
         from src.llm.router import QueryRouter
@@ -211,7 +364,9 @@ class VoicePipeline:
                 else:
                     print("Note: ANTHROPIC_API_KEY not set — hybrid mode will use local only.")
 
-        cloud_fn = self._stream_cloud if self._cloud_llm and self._cloud_llm.available else None
+        # CloudLLM.stream is handed over as-is: a pass-through wrapper would
+        # add a generator frame switch per chunk for nothing
+        cloud_fn = self._cloud_llm.stream if self._cloud_llm and self._cloud_llm.available else None
         self._router = QueryRouter(
             mode=self.router_mode,
             local_fn=self._stream_local,
@@ -227,7 +382,7 @@ class VoicePipeline:
 
     def _stream_local(self, prompt: str) -> Generator[str, None, None]:
         """Stream response from local Ollama/Qwen3."""
-        response = requests.post(
+        response = self._http.post(
             f"{self.ollama_url}/api/chat",
             json={
                 "model": self.model,
@@ -245,31 +400,41 @@ class VoicePipeline:
             timeout=60
         )
 
-        for line in response.iter_lines():
-            if line:
-                data = json.loads(line)
-                if "message" in data and "content" in data["message"]:
-                    chunk = data["message"]["content"]
-                    if chunk:
-                        yield chunk
-                if data.get("done", False):
-                    break
-
-    def _stream_cloud(self, prompt: str) -> Generator[str, None, None]:
-        """Stream response from Claude API."""
-        yield from self._cloud_llm.stream(prompt)
+        # Read to the end rather than breaking on "done" (always the last
+        # line) so the connection goes back to the pool for the next turn
+        with response:
+            for line in response.iter_lines():
+                if line:
+                    data = json.loads(line)
+                    message = data.get("message")
+                    if message:
+                        chunk = message.get("content")
+                        if chunk:
+                            yield chunk
+
+    def _make_input_stream(self) -> AudioReader:
+        """Blocking reader on the shared mic stream (also feeds the wake word detector)."""
+        return AudioHub.instance().open_reader()
 
     def _calculate_rms(self, audio: np.ndarray) -> float:
         """Calculate RMS (volume level) of audio."""
-        return float(np.sqrt(np.mean(audio ** 2)))
+        flat = audio.ravel()
+        # Dot product: one BLAS pass, no squared temporary array
+        return math.sqrt(float(flat @ flat) / flat.size)
 
-    def record_audio(self) -> Optional[np.ndarray]:
+    def record_audio(
+        self, transcriber: Optional[_StreamingTranscriber] = None
+    ) -> Optional[np.ndarray]:
         """
         Record audio from microphone until silence is detected.
 
         Uses Silero VAD (neural speech classifier) by default, or falls back
         to RMS energy detection when use_vad=False.
 
+        Args:
+            transcriber: If given, each speech segment is handed to it as
+                soon as a short pause closes it, so STT overlaps recording.
+
         Returns:
             Audio as numpy array, or None if no speech detected.
         """
@@ -279,61 +444,100 @@ class VoicePipeline:
         if self.use_vad and self._vad_model is not None:
             self._vad_model.reset_states()
 
-        audio_chunks = []
+        buf = self._record_buf
+        write_idx = 0                # Samples recorded so far
         silence_chunks = 0
         chunks_per_second = self.SAMPLE_RATE / self.BLOCK_SIZE
         silence_chunks_needed = int(self.SILENCE_DURATION * chunks_per_second)
         max_chunks = int(self.MAX_RECORD_SECONDS * chunks_per_second)
+        pause_chunks = int(self.SEGMENT_PAUSE * chunks_per_second)
+        max_segment_chunks = int(self.MAX_SEGMENT_SECONDS * chunks_per_second)
 
-        has_speech = False
+        # RMS mode compares energy (sum of squares) against threshold² · n,
+        # which skips the sqrt per block
+        rms_threshold_sq = self.SILENCE_THRESHOLD ** 2
+        # An EMA of block power arms the end-of-speech check, so a single
+        # loud click doesn't count as the user having spoken
+        power_ema = 0.0
 
-        def audio_callback(indata, frames, time_info, status):
-            self._audio_queue.put(indata.copy())
+        has_speech = False
+        segment_start = 0            # Sample index where the open segment begins
+        segment_has_speech = False
+
+        # Blocking reads from the shared mic stream, re-blocked to
+        # BLOCK_SIZE. The reader stays attached between turns once
+        # load_models() has run; otherwise open one for this recording.
+        if self._input_stream is not None:
+            stream_ctx = nullcontext(self._input_stream)
+        else:
+            stream_ctx = self._make_input_stream()
+        with stream_ctx as stream:
+            # Drop audio buffered while we weren't listening
+            stale = stream.read_available
+            if stale:
+                stream.read(stale)
 
-        with sd.InputStream(
-            samplerate=self.SAMPLE_RATE,
-            channels=self.CHANNELS,
-            blocksize=self.BLOCK_SIZE,
-            callback=audio_callback
-        ):
             chunk_count = 0
             while chunk_count < max_chunks:
-                try:
-                    chunk = self._audio_queue.get(timeout=0.5)
-                    audio_chunks.append(chunk)
-                    chunk_count += 1
-
-                    if self.use_vad and self._vad_model is not None:
-                        prob = self._speech_probability(chunk)
-                        is_speech = prob > self.SILENCE_THRESHOLD
-                        if self.debug:
-                            rms = self._calculate_rms(chunk)
-                            print(f" [VAD] prob={prob:.2f} rms={rms:.4f}", end="", flush=True)
-                    else:
+                data, _overflowed = stream.read(self.BLOCK_SIZE)
+                end = min(write_idx + self.BLOCK_SIZE, len(buf))
+                buf[write_idx:end] = data[:end - write_idx]
+                chunk = buf[write_idx:end]
+                write_idx = end
+                chunk_count += 1
+
+                if self.use_vad and self._vad_model is not None:
+                    prob = self._speech_probability(chunk)
+                    is_speech = prob > self.SILENCE_THRESHOLD
+                    speech_onset = is_speech  # Silero already rejects clicks
+                    if self.debug:
                         rms = self._calculate_rms(chunk)
-                        is_speech = rms > self.SILENCE_THRESHOLD
-                        if self.debug:
-                            print(".", end="", flush=True) if is_speech else None
+                        print(f" [VAD] prob={prob:.2f} rms={rms:.4f}", end="", flush=True)
+                else:
+                    power = float(chunk @ chunk) / chunk.size
+                    power_ema = self.POWER_EMA_ALPHA * power + (1 - self.POWER_EMA_ALPHA) * power_ema
+                    is_speech = power > rms_threshold_sq
+                    speech_onset = power_ema > rms_threshold_sq
+                    if self.debug:
+                        print(".", end="", flush=True) if is_speech else None
 
-                    if is_speech:
-                        has_speech = True
-                        silence_chunks = 0
-                    else:
-                        silence_chunks += 1
+                if speech_onset:
+                    has_speech = True
+                if is_speech:
+                    segment_has_speech = True
+                    silence_chunks = 0
+                else:
+                    silence_chunks += 1
 
-                    # End recording after enough silence (only if we've heard speech)
-                    if has_speech and silence_chunks >= silence_chunks_needed:
-                        break
+                # End recording after enough silence (only if we've heard speech)
+                if has_speech and silence_chunks >= silence_chunks_needed:
+                    break
 
-                except queue.Empty:
-                    continue
+                # Close the segment at a pause (or when it gets long) and
+                # start transcribing it while the user keeps talking
+                if transcriber is not None and segment_has_speech and (
+                    silence_chunks >= pause_chunks
+                    or end - segment_start >= max_segment_chunks * self.BLOCK_SIZE
+                ):
+                    transcriber.add_segment(buf[segment_start:end])
+                    segment_start = end
+                    segment_has_speech = False
 
         print()  # New line after "Listening..."
 
-        if not has_speech or len(audio_chunks) < 5:
+        end = write_idx
+
+        if not has_speech:
+            if transcriber is not None:
+                transcriber.cancel()
             return None
 
-        return np.concatenate(audio_chunks).flatten()
+        if transcriber is not None and segment_has_speech:
+            transcriber.add_segment(buf[segment_start:end])
+
+        # A view, not a copy: the buffer is only reused by the next recording,
+        # after this one has been transcribed
+        return buf[:end]
 
     def transcribe(self, audio: np.ndarray) -> tuple[str, float]:
         """
@@ -342,16 +546,10 @@ class VoicePipeline:
         Returns:
             Tuple of (text, latency_ms)
         """
-        # Save to temp file (faster-whisper needs file path)
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            sf.write(f.name, audio, self.SAMPLE_RATE)
-            temp_path = f.name
-
-        try:
-            text, latency_ms = self.stt.transcribe(temp_path)
-            return text.strip(), latency_ms
-        finally:
-            os.unlink(temp_path)
+        # faster-whisper takes 16kHz float32 samples directly — no temp WAV
+        # encode/write/unlink between end of speech and transcription
+        text, latency_ms = self.stt.transcribe(np.ascontiguousarray(audio, dtype=np.float32))
+        return text.strip(), latency_ms
 
     def generate_response(self, prompt: str) -> tuple[Generator[str, None, None], str]:
         """
@@ -375,26 +573,56 @@ class VoicePipeline:
 
         return self._router.route(prompt), backend
 
+    def _synthesize_timed(self, text: str) -> tuple[np.ndarray, float]:
+        """Synthesize on a TTS pool worker. Returns (int16 audio, synthesis ms)."""
+        cached = self._tts_cache.get(text)
+        if cached is not None:
+            return cached, 0.0
+
+        start = time.perf_counter()
+        if torch.cuda.is_available():
+            stream = getattr(self._tts_local, "stream", None)
+            if stream is None:
+                stream = self._tts_local.stream = torch.cuda.Stream()
+            with torch.cuda.stream(stream):
+                audio = self.tts.synthesize_int16(text)  # .cpu() syncs the stream
+        else:
+            audio = self.tts.synthesize_int16(text)
+        return audio, (time.perf_counter() - start) * 1000
+
     def split_sentences(self, text: str) -> list[str]:
         """Split text into sentences for TTS."""
         # Split on sentence endings, keeping the punctuation
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Strip each piece once, then drop the empty ones
+        return [s for s in map(str.strip, _SPLIT_RE.split(text)) if s]
 
-    def speak_streaming(self, text_generator: Generator[str, None, None]) -> dict:
+    def speak_streaming(
+        self,
+        text_generator: Generator[str, None, None],
+        on_event: Optional[Callable[[str, int], None]] = None,
+    ) -> dict:
         """
         Synthesize and play speech as text streams in.
 
         Optimized for low latency:
         - Starts TTS as soon as we have a sentence ending OR enough chars
-        - Synthesizes in parallel with LLM generation
+        - Synthesizes on a worker pool in parallel with LLM generation;
+          playback follows submission order
+
+        Args:
+            text_generator: Stream of LLM response chunks.
+            on_event: Optional callback, called as on_event(name, perf_counter_ns)
+                for "llm_first" and "tts_first" the moment they happen.
 
         Returns:
             Dict with full_text, first_token_ms, first_audio_ms,
             llm_total_ms, tts_total_ms, playback_ms, token_count.
         """
-        buffer = ""
-        full_text = ""
+        # Token lists, joined only when text is dispatched (no per-token
+        # string rebuild)
+        buffer_parts: list[str] = []
+        buffer_len = 0
+        full_parts: list[str] = []
         first_token_time = None
         first_audio_time = None
         start_time = time.perf_counter()
@@ -404,25 +632,45 @@ class VoicePipeline:
         # Minimum chars before first synthesis (for fast first audio)
         MIN_FIRST_CHUNK = 20
 
-        # Queue for audio chunks to play
+        # Pending synthesis futures, in sentence order
         audio_queue = queue.Queue()
         playback_done = threading.Event()
         playback_total_ms = 0.0
+        playback_error = None
 
         def playback_worker():
-            nonlocal playback_total_ms
-            """Play audio chunks from queue. Sets state to SPEAKING during playback."""
-            while True:
-                item = audio_queue.get()
-                if item is None:  # Sentinel to stop
-                    break
-                # Set state to SPEAKING to mute mic during playback
-                self._state = PipelineState.SPEAKING
-                play_start = time.perf_counter()
-                sd.play(item, self.TTS_SAMPLE_RATE)
-                sd.wait()
-                playback_total_ms += (time.perf_counter() - play_start) * 1000
-            playback_done.set()
+            """Play synthesized chunks in order. Sets state to SPEAKING during playback."""
+            nonlocal playback_total_ms, playback_error, first_audio_time, tts_total_ms
+            try:
+                while True:
+                    future = audio_queue.get()
+                    if future is None:  # Sentinel to stop
+                        break
+                    audio, synth_ms = future.result()
+                    tts_total_ms += synth_ms
+                    if first_audio_time is None:
+                        first_audio_time = (time.perf_counter() - start_time) * 1000
+                        if on_event is not None:
+                            on_event("tts_first", time.perf_counter_ns())
+                    # Set state to SPEAKING to mute mic during playback
+                    self._state = PipelineState.SPEAKING
+                    play_start = time.perf_counter()
+                    if self._out_stream is not None:
+                        # Returns once queued, so the next sentence follows gap-free
+                        self._out_stream.write(
+                            np.ascontiguousarray(audio, dtype=np.int16).reshape(-1, 1)
+                        )
+                    else:
+                        sd.play(audio, self.TTS_SAMPLE_RATE)
+                        sd.wait()
+                    playback_total_ms += (time.perf_counter() - play_start) * 1000
+            except Exception as e:
+                playback_error = e
+                # Drain so the producer's remaining futures aren't played
+                while audio_queue.get() is not None:
+                    pass
+            finally:
+                playback_done.set()
 
         # Start playback thread
         playback_thread = threading.Thread(target=playback_worker, daemon=True)
@@ -432,13 +680,8 @@ class VoicePipeline:
         llm_done_time = None
 
         def _synthesize_chunk(text_to_speak: str):
-            nonlocal first_audio_time, tts_total_ms, first_chunk_sent
-            tts_start = time.perf_counter()
-            audio = self.tts.synthesize(text_to_speak)
-            tts_total_ms += (time.perf_counter() - tts_start) * 1000
-            if first_audio_time is None:
-                first_audio_time = (time.perf_counter() - start_time) * 1000
-            audio_queue.put(audio)
+            nonlocal first_chunk_sent
+            audio_queue.put(self._tts_pool.submit(self._synthesize_timed, text_to_speak))
             first_chunk_sent = True
 
         try:
@@ -446,41 +689,54 @@ class VoicePipeline:
                 token_count += 1
                 if first_token_time is None:
                     first_token_time = (time.perf_counter() - start_time) * 1000
-
-                buffer += chunk
-                full_text += chunk
-
-                # Check for sentence endings
-                if re.search(r'[.!?]\s*$', buffer):
-                    if buffer.strip():
-                        _synthesize_chunk(buffer.strip())
-                    buffer = ""
+                    if on_event is not None:
+                        on_event("llm_first", time.perf_counter_ns())
+
+                buffer_parts.append(chunk)
+                buffer_len += len(chunk)
+                full_parts.append(chunk)
+
+                # Check for sentence endings. The buffer never ends in one
+                # between tokens, so only the new chunk needs scanning.
+                if _SENT_END_RE.search(chunk):
+                    buffer = "".join(buffer_parts).strip()
+                    if buffer:
+                        _synthesize_chunk(buffer)
+                    buffer_parts.clear()
+                    buffer_len = 0
 
                 # For first chunk, also trigger on comma or enough chars
-                elif not first_chunk_sent and len(buffer) >= MIN_FIRST_CHUNK:
-                    if ',' in buffer or len(buffer) >= 40:
+                elif not first_chunk_sent and buffer_len >= MIN_FIRST_CHUNK:
+                    buffer = "".join(buffer_parts)
+                    if ',' in buffer or buffer_len >= 40:
                         split_idx = buffer.rfind(',')
                         if split_idx == -1 or split_idx < 10:
-                            split_idx = len(buffer)
+                            split_idx = buffer_len
 
                         chunk_to_speak = buffer[:split_idx].strip()
                         if chunk_to_speak:
                             _synthesize_chunk(chunk_to_speak)
                             buffer = buffer[split_idx:].lstrip(',').strip()
+                            buffer_parts = [buffer]
+                            buffer_len = len(buffer)
 
             llm_done_time = (time.perf_counter() - start_time) * 1000
 
             # Synthesize any remaining text
-            if buffer.strip():
-                _synthesize_chunk(buffer.strip())
+            buffer = "".join(buffer_parts).strip()
+            if buffer:
+                _synthesize_chunk(buffer)
 
         finally:
             # Signal playback to stop and wait
             audio_queue.put(None)
             playback_done.wait(timeout=30)
 
+        if playback_error is not None:
+            raise playback_error
+
         return {
-            "full_text": full_text.strip(),
+            "full_text": "".join(full_parts).strip(),
             "first_token_ms": first_token_time or 0,
             "first_audio_ms": first_audio_time or 0,
             "llm_total_ms": llm_done_time or 0,
@@ -489,21 +745,40 @@ class VoicePipeline:
             "token_count": token_count,
         }
 
-    def process_query(self, audio: np.ndarray) -> PipelineMetrics:
+    def process_query(
+        self,
+        audio: np.ndarray,
+        on_event: Optional[Callable[[str, int], None]] = None,
+        transcriber: Optional[_StreamingTranscriber] = None,
+    ) -> PipelineMetrics:
         """
         Process a single voice query through the full pipeline.
 
+        Args:
+            audio: 16kHz mono float32 audio.
+            on_event: Optional stage callback, see process_file_streaming().
+            transcriber: Streaming transcriber record_audio() already fed;
+                its transcript is used instead of transcribing `audio`, and
+                stt_ms is only the wait for its last segment.
+
         Returns:
             PipelineMetrics with timing and text data.
         """
         metrics = PipelineMetrics()
         e2e_start = time.perf_counter()
+        if on_event is not None:
+            on_event("start", time.perf_counter_ns())
 
         # STT
         stt_start = time.perf_counter()
-        user_text, _ = self.transcribe(audio)
+        if transcriber is not None:
+            user_text = transcriber.result().strip()
+        else:
+            user_text, _ = self.transcribe(audio)
         metrics.stt_ms = (time.perf_counter() - stt_start) * 1000
         metrics.user_text = user_text
+        if on_event is not None:
+            on_event("stt_done", time.perf_counter_ns())
 
         if not user_text:
             return metrics
@@ -511,7 +786,7 @@ class VoicePipeline:
         # LLM + TTS (streaming)
         response_generator, backend = self.generate_response(user_text)
         metrics.llm_backend = backend
-        result = self.speak_streaming(response_generator)
+        result = self.speak_streaming(response_generator, on_event=on_event)
 
         metrics.llm_first_token_ms = result["first_token_ms"]
         metrics.llm_total_ms = result["llm_total_ms"]
@@ -522,8 +797,33 @@ class VoicePipeline:
         metrics.jett_text = result["full_text"]
         metrics.e2e_ms = (time.perf_counter() - e2e_start) * 1000
 
+        self._record_metrics(metrics)
         return metrics
 
+    def _record_metrics(self, metrics: PipelineMetrics) -> None:
+        """Append a turn's timings to the session history."""
+        if self._metrics_n == len(self._metrics_buf):
+            self._metrics_buf = np.concatenate(
+                (self._metrics_buf, np.empty_like(self._metrics_buf))
+            )
+        self._metrics_buf[self._metrics_n] = [getattr(metrics, f) for f in _TIMING_FIELDS]
+        self._metrics_n += 1
+
+    def session_percentiles(self, q: float) -> dict[str, float]:
+        """
+        Percentile of each timing field over all turns so far.
+
+        Args:
+            q: Percentile in [0, 100], e.g. 95.
+
+        Returns:
+            Dict of field name → ms (empty before the first turn).
+        """
+        if self._metrics_n == 0:
+            return {}
+        values = np.percentile(self._metrics_buf[:self._metrics_n], q, axis=0)
+        return dict(zip(_TIMING_FIELDS, values.tolist()))
+
     def print_metrics(self, metrics: PipelineMetrics) -> None:
         """Print interaction metrics with full component breakdown."""
         print()
@@ -539,6 +839,10 @@ class VoicePipeline:
         print(f"  E2E:            {metrics.e2e_ms:>6.0f}ms")
         print(f"  User: \"{metrics.user_text}\"")
         print(f"  Jett: \"{metrics.jett_text[:120]}{'...' if len(metrics.jett_text) > 120 else ''}\"")
+        if self._metrics_n > 1:
+            e2e = self._metrics_buf[:self._metrics_n, _E2E_COL]
+            p50, p95 = np.percentile(e2e, (50, 95))
+            print(f"  Session E2E:    p50 {p50:.0f}ms / p95 {p95:.0f}ms  ({self._metrics_n} turns)")
         print("---------------------")
         print()
 
@@ -589,8 +893,9 @@ class VoicePipeline:
                     time.sleep(0.1)
                     continue
 
-                # Record audio
-                audio = self.record_audio()
+                # Record audio, transcribing segments as they close
+                transcriber = _StreamingTranscriber(self.stt) if self.stream_stt else None
+                audio = self.record_audio(transcriber)
 
                 if audio is None:
                     # No speech — return to appropriate state
@@ -609,7 +914,7 @@ class VoicePipeline:
 
                 # Process through pipeline
                 try:
-                    metrics = self.process_query(audio)
+                    metrics = self.process_query(audio, transcriber=transcriber)
 
                     if metrics.user_text:
                         self.print_metrics(metrics)
@@ -640,6 +945,33 @@ class VoicePipeline:
             self._running = False
             if self.wake_word_detector is not None:
                 self.wake_word_detector.stop()
+            self.close()
+
+    def close(self) -> None:
+        """Release the audio streams, the TTS workers and the Ollama connection."""
+        for stream in (self._input_stream, self._out_stream):
+            if stream is not None:
+                stream.close()
+        self._input_stream = None
+        self._out_stream = None
+        self._tts_pool.shutdown(wait=False)
+        self._http.close()
+
+    def _load_audio_file(self, audio_path: str) -> np.ndarray:
+        """Load an audio file as 16kHz mono float32."""
+        audio, sr = sf.read(audio_path, dtype="float32")
+
+        # Ensure mono (before resampling, so only one channel is filtered)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+
+        # Resample if needed: polyphase FIR, linear in length (no full-clip FFT)
+        if sr != self.SAMPLE_RATE:
+            import scipy.signal
+            g = math.gcd(sr, self.SAMPLE_RATE)
+            audio = scipy.signal.resample_poly(audio, self.SAMPLE_RATE // g, sr // g)
+
+        return audio.astype(np.float32, copy=False)
 
     def process_file(self, audio_path: str) -> PipelineMetrics:
         """
@@ -650,22 +982,47 @@ class VoicePipeline:
         if self.stt is None or self.tts is None:
             self.load_models()
 
-        # Load audio file
-        audio, sr = sf.read(audio_path)
+        return self.process_query(self._load_audio_file(audio_path))
 
-        # Resample if needed
-        if sr != self.SAMPLE_RATE:
-            import scipy.signal
-            audio = scipy.signal.resample(
-                audio,
-                int(len(audio) * self.SAMPLE_RATE / sr)
-            )
+    def process_file_streaming(
+        self, audio_path: str
+    ) -> Generator[tuple[str, object], None, None]:
+        """
+        Process a pre-recorded audio file, yielding stage events as they occur.
 
-        # Ensure mono
-        if len(audio.shape) > 1:
-            audio = audio.mean(axis=1)
+        The query runs on a worker thread (LLM streaming and TTS already
+        overlap inside speak_streaming); events are forwarded as soon as each
+        stage fires rather than after the whole interaction completes.
+
+        Yields:
+            ("start", t), ("stt_done", t), ("llm_first", t), ("tts_first", t)
+            with perf_counter_ns timestamps, then ("done", PipelineMetrics).
+            Re-raises any pipeline error after the events emitted so far.
+        """
+        if self.stt is None or self.tts is None:
+            self.load_models()
 
-        return self.process_query(audio.astype(np.float32))
+        audio = self._load_audio_file(audio_path)
+        events: queue.Queue = queue.Queue()
+
+        def worker():
+            try:
+                metrics = self.process_query(
+                    audio, on_event=lambda name, ts: events.put((name, ts))
+                )
+                events.put(("done", metrics))
+            except Exception as e:
+                events.put(("error", e))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+        while True:
+            name, value = events.get()
+            if name == "error":
+                raise value
+            yield name, value
+            if name == "done":
+                return
 
 
 def main():
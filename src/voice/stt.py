@@ -29,23 +29,39 @@ _setup_cuda_paths()
 
 import time
 from pathlib import Path
+from typing import Optional, Union
 
+import ctranslate2
+import numpy as np
 from faster_whisper import WhisperModel
 
+try:
+    from faster_whisper import BatchedInferencePipeline  # faster-whisper >= 1.1
+except ImportError:
+    BatchedInferencePipeline = None
+
+# Preference order for compute_type="auto" on CUDA: int8 GEMMs on tensor
+# cores first; float16 where the GPU has no int8 kernels (e.g. sm_120)
+_CUDA_COMPUTE_TYPES = ("int8_float16", "float16", "int8")
+
 
 class STT:
     """Speech-to-Text engine using faster-whisper."""
 
+    # VAD chunks decoded together per batch by the batched pipeline
+    BATCH_SIZE = 8
+
     def __init__(
         self,
         model_size: str = "distil-large-v3",
         device: str = "cuda",
-        compute_type: str = "int8"
+        compute_type: str = "auto"
     ):
         self.model_size = model_size
         self.device = device
         self.compute_type = compute_type
         self.model = None
+        self._batched = None
 
     def load(self) -> float:
         """
@@ -54,6 +70,7 @@ class STT:
         Returns:
             Load time in seconds.
         """
+        self.device, self.compute_type = self._resolve_compute_type()
         print(f"Loading {self.model_size} ({self.compute_type}) on {self.device}...")
         start = time.perf_counter()
 
@@ -62,17 +79,70 @@ class STT:
             device=self.device,
             compute_type=self.compute_type
         )
+        if BatchedInferencePipeline is not None:
+            self._batched = BatchedInferencePipeline(model=self.model)
 
         elapsed = time.perf_counter() - start
         print(f"Model loaded in {elapsed:.1f}s")
         return elapsed
 
-    def transcribe(self, audio_path: str) -> tuple[str, float]:
+    def _resolve_compute_type(self) -> tuple[str, str]:
+        """
+        Pick (device, compute_type), resolving compute_type="auto".
+
+        On CUDA, takes the first of _CUDA_COMPUTE_TYPES the GPU supports;
+        without a usable GPU, falls back to int8 on the CPU.
+        """
+        if self.compute_type != "auto":
+            return self.device, self.compute_type
+
+        if self.device == "cuda":
+            try:
+                supported = ctranslate2.get_supported_compute_types("cuda")
+            except RuntimeError:
+                supported = set()  # No CUDA device / driver
+            for compute_type in _CUDA_COMPUTE_TYPES:
+                if compute_type in supported:
+                    return "cuda", compute_type
+            print("Warning: no supported CUDA compute type, falling back to CPU")
+
+        return "cpu", "int8"
+
+    def warmup(self) -> float:
+        """
+        Run one decode on a second of silence so the first real turn doesn't
+        pay for CUDA context setup, cuBLAS handles and kernel selection.
+
+        Returns:
+            Warmup time in ms.
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        start = time.perf_counter()
+        # vad_filter off: with it on, silence is dropped before the encoder runs
+        segments, _ = self.model.transcribe(
+            np.zeros(16000, dtype=np.float32),
+            language="en",
+            vad_filter=False,
+        )
+        for _ in segments:  # Decoding is lazy; drain to run it
+            pass
+        return (time.perf_counter() - start) * 1000
+
+    def transcribe(
+        self,
+        audio: Union[str, np.ndarray],
+        initial_prompt: Optional[str] = None,
+    ) -> tuple[str, float]:
         """
-        Transcribe audio file to text.
+        Transcribe audio to text.
 
         Args:
-            audio_path: Path to audio file (wav, mp3, etc.)
+            audio: Path to audio file (wav, mp3, etc.), or 16kHz mono
+                float32 samples — arrays skip file decoding entirely.
+            initial_prompt: Text preceding this audio (e.g. the transcript of
+                earlier segments of the same utterance), for continuity.
 
         Returns:
             Tuple of (transcribed text, latency in ms)
@@ -82,12 +152,20 @@ class STT:
 
         start = time.perf_counter()
 
-        segments, info = self.model.transcribe(
-            audio_path,
+        options = dict(
             language="en",  # Force English to skip language detection (faster + avoids errors)
             vad_filter=True,
-            vad_parameters={"min_silence_duration_ms": 500}
+            vad_parameters={"min_silence_duration_ms": 500},
+            initial_prompt=initial_prompt,
+            # Only plain text is needed: greedy decoding, no timestamp tokens
+            beam_size=1,
+            without_timestamps=True,
         )
+        if self._batched is not None:
+            # Voiced VAD chunks are decoded as one batch instead of one by one
+            segments, info = self._batched.transcribe(audio, batch_size=self.BATCH_SIZE, **options)
+        else:
+            segments, info = self.model.transcribe(audio, **options)
 
         # Collect all segments into single string
         text = " ".join(segment.text.strip() for segment in segments)
@@ -25,6 +25,19 @@ from typing import Generator
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
+import torch
+
+
+def _to_numpy(audio) -> np.ndarray:
+    """Model output tensor as float32 numpy (fp16 autocast may yield half)."""
+    return audio.float().cpu().numpy()
+
+
+def _concat_to_numpy(chunks: list) -> np.ndarray:
+    """Join output tensors where they are, then copy to the host once."""
+    if not chunks:
+        return np.array([])
+    return _to_numpy(chunks[0] if len(chunks) == 1 else torch.cat(chunks))
 
 
 class TTS:
@@ -36,7 +49,8 @@ class TTS:
         self,
         voice: str = "af_heart",
         device: str = "cuda",
-        speed: float = 1.0
+        speed: float = 1.0,
+        fp16: bool = False,
     ):
         """
         Initialize TTS engine.
@@ -45,10 +59,12 @@ class TTS:
             voice: Voice preset (default: af_heart - American female)
             device: 'cuda' or 'cpu'
             speed: Speech speed multiplier (1.0 = normal)
+            fp16: Run the model under float16 autocast (CUDA only)
         """
         self.voice = voice
         self.device = device
         self.speed = speed
+        self.fp16 = fp16
         self.pipeline = None
 
     def load(self) -> float:
@@ -72,6 +88,20 @@ class TTS:
             device=self.device
         )
 
+        # Load the voice pack now and keep it on the device. KPipeline caches
+        # packs by name on the CPU and moves the pack to the model's device
+        # on every call; with the cached copy already there, that move is a
+        # no-op instead of a host→device copy per sentence.
+        pack = self.pipeline.load_voice(self.voice)
+        self.pipeline.voices[self.voice] = pack.to(self.device)
+
+        if self.fp16 and self.device.startswith("cuda"):
+            import torch
+            # Autocast each forward pass; weights stay float32, so the
+            # fp32 voice packs and LSTM inputs need no casting
+            model = self.pipeline.model
+            model.forward = torch.autocast("cuda", dtype=torch.float16)(model.forward)
+
         elapsed = time.perf_counter() - start
         print(f"TTS loaded in {elapsed:.1f}s")
         return elapsed
@@ -89,12 +119,27 @@ class TTS:
         if self.pipeline is None:
             raise RuntimeError("Model not loaded. Call load() first.")
 
-        audio_chunks = []
-        for result in self.pipeline(text, voice=self.voice, speed=self.speed):
-            # Convert torch tensor to numpy
-            audio_chunks.append(result.audio.cpu().numpy())
+        # Keep chunks as tensors: one device→host copy per call, not per chunk
+        audio_chunks = [
+            result.audio
+            for result in self.pipeline(text, voice=self.voice, speed=self.speed)
+        ]
+        return _concat_to_numpy(audio_chunks)
+
+    def synthesize_int16(self, text: str) -> np.ndarray:
+        """
+        Convert text to 16-bit PCM audio, half the size of synthesize()'s output.
+
+        Args:
+            text: Text to synthesize
 
-        return np.concatenate(audio_chunks) if audio_chunks else np.array([])
+        Returns:
+            Audio as numpy array (24kHz, int16)
+        """
+        scaled = self.synthesize(text) * 32767.0
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        return scaled.astype(np.int16)
 
     def synthesize_timed(self, text: str) -> tuple[np.ndarray, float, float]:
         """
@@ -113,13 +158,55 @@ class TTS:
         for result in self.pipeline(text, voice=self.voice, speed=self.speed):
             if first_chunk_time is None:
                 first_chunk_time = (time.perf_counter() - start) * 1000
-            audio_chunks.append(result.audio.cpu().numpy())
+            audio_chunks.append(result.audio)
 
+        audio = _concat_to_numpy(audio_chunks)
         total_time = (time.perf_counter() - start) * 1000
-        audio = np.concatenate(audio_chunks) if audio_chunks else np.array([])
 
         return audio, first_chunk_time or 0, total_time
 
+    def synthesize_batch_timed(
+        self, texts: list[str]
+    ) -> list[tuple[np.ndarray, float, float]]:
+        """
+        Synthesize several texts in a single pipeline pass, with timing info.
+
+        Kokoro still runs one forward pass per segment, but a single call
+        loads and transfers the voice pack once for the whole batch.
+        Timings for each text are measured from the end of the previous one.
+
+        Returns:
+            List of (audio, time_to_first_chunk_ms, total_time_ms), one per text.
+        """
+        if self.pipeline is None:
+            raise RuntimeError("Model not loaded. Call load() first.")
+
+        chunks: list[list] = [[] for _ in texts]
+        first_ms = [0.0] * len(texts)
+        total_ms = [0.0] * len(texts)
+
+        current = None
+        segment_start = time.perf_counter()
+        last_chunk_time = segment_start
+
+        # Passing a list makes Kokoro treat each entry as its own segment
+        # and tag results with its text_index.
+        for result in self.pipeline(texts, voice=self.voice, speed=self.speed):
+            now = time.perf_counter()
+            idx = result.text_index
+            if idx != current:
+                current = idx
+                segment_start = last_chunk_time
+                first_ms[idx] = (now - segment_start) * 1000
+            chunks[idx].append(result.audio)
+            total_ms[idx] = (now - segment_start) * 1000
+            last_chunk_time = now
+
+        return [
+            (_concat_to_numpy(c), first_ms[i], total_ms[i])
+            for i, c in enumerate(chunks)
+        ]
+
     def stream_sentences(self, text: str) -> Generator[np.ndarray, None, None]:
         """
         Stream audio by sentence for lower latency.
@@ -136,7 +223,7 @@ class TTS:
             raise RuntimeError("Model not loaded. Call load() first.")
 
         for result in self.pipeline(text, voice=self.voice, speed=self.speed):
-            yield result.audio.cpu().numpy()
+            yield _to_numpy(result.audio)
 
     def play(self, audio: np.ndarray, blocking: bool = True) -> None:
         """
@@ -5,8 +5,8 @@ Listens for "Hey Jett" using a custom-trained openWakeWord model
 (models/hey_jett.onnx) and triggers a callback when detected.
 Runs on CPU with ~1% usage.
 
-The detector manages its own audio stream (16kHz, mono, 1280-sample chunks)
-and runs independently of the main pipeline recording stream.
+The detector subscribes to the shared microphone stream (AudioHub: 16kHz,
+mono, 1280-sample chunks), the same stream the pipeline records from.
 
 Usage:
     from src.voice.wake_word import WakeWordDetector
@@ -20,6 +20,8 @@ Usage:
     detector.stop()
 """
 
+import math
+import queue
 import threading
 import time
 from pathlib import Path
@@ -29,6 +31,13 @@ import numpy as np
 import sounddevice as sd
 
 
+def _audio_hub():
+    """Shared AudioHub (imported here: the standalone test runs without src on the path)."""
+    from src.voice.audio_hub import AudioHub
+
+    return AudioHub.instance()
+
+
 class WakeWordDetector:
     """
     Wake word detector using openWakeWord.
@@ -49,33 +58,56 @@ class WakeWordDetector:
     DEFAULT_THRESHOLD = 0.5
     COOLDOWN_SECONDS = 2.0
 
+    # Chunks (80ms each) that may wait for the model before new ones are dropped
+    MAX_PENDING_CHUNKS = 16
+
     def __init__(
         self,
         model_path: Optional[Path] = None,
         threshold: float = DEFAULT_THRESHOLD,
         debug: bool = False,
+        quantized: bool = False,
     ):
-        self.model_path = str(model_path or self.DEFAULT_MODEL_PATH)
+        model_path = Path(model_path or self.DEFAULT_MODEL_PATH)
+        if quantized:
+            # INT8 copy written by scripts/quantize_wakeword.py, if present
+            int8_path = model_path.with_suffix(".int8.onnx")
+            if int8_path.exists():
+                model_path = int8_path
+            elif debug:
+                print(f"[Wake] No {int8_path.name}, using float model")
+        self.model_path = str(model_path)
         # openWakeWord uses the filename stem as the prediction dict key
         self._model_key = Path(self.model_path).stem
         self.threshold = threshold
         self.debug = debug
 
         self._model = None
-        self._stream: Optional[sd.InputStream] = None
         self._on_wake: Optional[Callable] = None
         self._running = False
 
-        # Pause flag — when cleared, audio callback skips prediction
+        # The audio thread only queues chunks; inference runs on _worker so
+        # the PortAudio callback never waits on the ONNX model
+        self._chunks: queue.Queue = queue.Queue(maxsize=self.MAX_PENDING_CHUNKS)
+        self._worker: Optional[threading.Thread] = None
+
+        # Pause flag — also checked per chunk, since chunks queued before
+        # pause() unsubscribes are still handed to the inference thread
         self._active = threading.Event()
         self._active.set()  # Start active (not paused)
 
-        # Cooldown tracking
-        self._last_trigger_time = 0.0
+        # Chunks arrive at a fixed rate (12.5/s), so the cooldown and the
+        # debug print throttle count chunks instead of reading the clock
+        chunks_per_second = self.SAMPLE_RATE / self.CHUNK_SIZE
+
+        # Cooldown tracking: chunks processed since the last trigger
+        self._cooldown_chunks = int(self.COOLDOWN_SECONDS * chunks_per_second)
+        self._chunks_since_trigger = self._cooldown_chunks  # Not cooling down
 
         # Debug: throttle score printing to ~1 per second
-        self._last_debug_print = 0.0
         self._debug_print_interval = 1.0
+        self._debug_print_every = int(chunks_per_second * self._debug_print_interval)
+        self._debug_counter = 0
         self._debug_audio_info_printed = False
 
     def _load_model(self) -> None:
@@ -92,17 +124,31 @@ class WakeWordDetector:
             print(f"[Wake] Model key: {self._model_key}")
             print(f"[Wake] Model keys: {list(self._model.models.keys())}")
 
-    def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
-        """Audio stream callback — feeds chunks to the wake word model."""
+    def _enqueue_chunk(self, audio: np.ndarray) -> None:
+        """AudioHub subscriber — hands a copy of each chunk to the inference thread."""
+        try:
+            self._chunks.put_nowait(audio.copy())
+        except queue.Full:
+            pass  # Model is behind; dropping beats delaying the audio thread
+
+    def _run_inference(self) -> None:
+        """Inference thread: predict on queued chunks until a None sentinel."""
+        while True:
+            audio_chunk = self._chunks.get()
+            if audio_chunk is None:
+                return
+            self._process_chunk(audio_chunk)
+
+    def _process_chunk(self, audio_chunk: np.ndarray) -> None:
+        """Feed one mono int16 chunk to the wake word model."""
         if not self._active.is_set():
             return
 
         if self._model is None:
             return
 
-        # Convert float32 [-1, 1] to int16 [-32768, 32767] — openWakeWord expects int16
-        audio_f32 = indata[:, 0]  # mono
-        audio_chunk = (audio_f32 * 32767).astype(np.int16)
+        # The hub captures int16, the format openWakeWord expects, so the
+        # chunk goes to the model as PortAudio delivered it
 
         # Debug: print audio format once on first callback
         if self.debug and not self._debug_audio_info_printed:
@@ -113,26 +159,28 @@ class WakeWordDetector:
         # Run prediction
         prediction = self._model.predict(audio_chunk)
 
-        # Debug: print all scores periodically (~1/sec)
+        score = prediction.get(self._model_key, 0.0)
+
+        if self._chunks_since_trigger < self._cooldown_chunks:
+            self._chunks_since_trigger += 1
+
+        # Debug: print the score periodically (~1/sec); only our model is loaded
         if self.debug:
-            now = time.monotonic()
-            if now - self._last_debug_print >= self._debug_print_interval:
-                self._last_debug_print = now
-                rms = float(np.sqrt(np.mean(audio_f32 ** 2)))
-                scores = ", ".join(f"{k}: {v:.2f}" for k, v in prediction.items())
-                print(f"[Wake] {scores}  (rms={rms:.4f})")
+            self._debug_counter += 1
+            if self._debug_counter >= self._debug_print_every:
+                self._debug_counter = 0
+                samples = audio_chunk.astype(np.float32)
+                rms = math.sqrt(float(samples @ samples) / samples.size) / 32768
+                print(f"[Wake] {self._model_key}: {score:.2f}  (rms={rms:.4f})")
 
         # Check if wake word confidence exceeds threshold
-        score = prediction.get(self._model_key, 0.0)
-
         if score > self.threshold:
-            now = time.monotonic()
-            if now - self._last_trigger_time < self.COOLDOWN_SECONDS:
+            if self._chunks_since_trigger < self._cooldown_chunks:
                 if self.debug:
                     print(f"[Wake] COOLDOWN: {self._model_key} score {score:.2f} > threshold {self.threshold} (ignored)")
                 return
 
-            self._last_trigger_time = now
+            self._chunks_since_trigger = 0
 
             if self.debug:
                 print(f"[Wake] TRIGGERED: {self._model_key} score {score:.2f} > threshold {self.threshold}")
@@ -163,36 +211,35 @@ class WakeWordDetector:
             print(f"[Wake] Audio device: {device_info['name']}")
             print(f"[Wake] Sample rate: {self.SAMPLE_RATE}Hz, Channels: {self.CHANNELS}, Chunk: {self.CHUNK_SIZE}")
 
-        self._stream = sd.InputStream(
-            samplerate=self.SAMPLE_RATE,
-            channels=self.CHANNELS,
-            blocksize=self.CHUNK_SIZE,
-            dtype="float32",
-            callback=self._audio_callback,
+        self._worker = threading.Thread(
+            target=self._run_inference, name="wake-word", daemon=True
         )
-        self._stream.start()
+        self._worker.start()
+        _audio_hub().subscribe(self._enqueue_chunk)
 
         if self.debug:
             print("[Wake] Stream started, listening...")
 
     def stop(self) -> None:
-        """Stop listening and close the audio stream."""
+        """Stop listening and detach from the shared audio stream."""
         if not self._running:
             return
 
         self._running = False
 
-        if self._stream is not None:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+        _audio_hub().unsubscribe(self._enqueue_chunk)
+        self._chunks.put(None)  # After any queued chunks
+        self._worker.join()
+        self._worker = None
 
         if self.debug:
             print("[WakeWord] Stream stopped")
 
     def pause(self) -> None:
-        """Pause detection (stream stays open but predictions are skipped)."""
+        """Pause detection: detach from the audio stream so no chunks reach Python."""
         self._active.clear()
+        if self._running:
+            _audio_hub().unsubscribe(self._enqueue_chunk)
         if self.debug:
             print("[WakeWord] Paused")
 
@@ -201,7 +248,12 @@ class WakeWordDetector:
         # Reset model state to avoid stale predictions triggering false positives
         if self._model is not None:
             self._model.reset()
+        # No chunks are counted while paused; a fresh model can't be repeating
+        # the trigger that paused it, so start with the cooldown expired
+        self._chunks_since_trigger = self._cooldown_chunks
         self._active.set()
+        if self._running:
+            _audio_hub().subscribe(self._enqueue_chunk)
         if self.debug:
             print("[WakeWord] Resumed")
 
@@ -229,13 +281,13 @@ if __name__ == "__main__":
     def callback(indata, frames, time_info, status):
         global frame_count, last_print
         frame_count += 1
-        audio_f32 = indata[:, 0]
-        # Convert to int16 — openWakeWord expects int16 audio
-        audio_int16 = (audio_f32 * 32767).astype(np.int16)
+        # Captured as int16 — the format openWakeWord expects
+        audio_int16 = indata[:, 0]
 
         prediction = model.predict(audio_int16)
         score = prediction.get(model_key, 0)
-        rms = float(np.sqrt(np.mean(audio_f32 ** 2)))
+        samples = audio_int16.astype(np.float32)
+        rms = math.sqrt(float(samples @ samples) / samples.size) / 32768
 
         # Print every second OR when score is non-zero
         now = time.monotonic()
@@ -251,10 +303,13 @@ if __name__ == "__main__":
     print("Listening... say 'Hey Jett'. Ctrl+C to stop.")
     print("Prints every 1s, or immediately when score > 0.001")
     print("-" * 65)
+    # Main thread just blocks; the timeout only bounds Ctrl+C latency, since
+    # an untimed wait isn't interruptible on Windows
+    stop_evt = threading.Event()
     with sd.InputStream(samplerate=16000, channels=1, blocksize=1280,
-                        dtype="float32", callback=callback):
+                        dtype="int16", callback=callback):
         try:
-            while True:
-                time.sleep(0.1)
+            while not stop_evt.wait(timeout=1.0):
+                pass
         except KeyboardInterrupt:
             print("\nDone.")
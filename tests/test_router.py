@@ -0,0 +1,80 @@
+"""
+Tests for the hybrid LLM router's query classifier.
+
+Checks that the optional Hyperscan backend and the re fallback agree, so
+routing doesn't depend on which one is installed.
+
+Run:
+    python -m pytest tests/test_router.py -v
+"""
+
+import threading
+
+import pytest
+
+from src.llm import router
+from src.llm.router import classify
+
+# Every pattern family, plus word-boundary edge cases around non-ASCII text
+CASES = [
+    "why is the sky blue",
+    "can you explain this",
+    "write me a poem about ça",
+    "what time is it",
+    "hello there",
+    "ok",
+    "ok!\n",
+    "okay then",
+    "naiveïwhy now",
+    "éwhy",
+    "whyé",
+    "café explain",
+    "ßwrite",
+    "why not",
+    "set a timer for ten minutes",
+    "the whyte house",
+    "",
+]
+
+needs_hyperscan = pytest.mark.skipif(
+    router.hyperscan is None, reason="hyperscan not installed"
+)
+
+
+@needs_hyperscan
+@pytest.mark.parametrize("text", CASES)
+def test_cloud_backends_agree(text):
+    assert router._has_match(router._CLOUD_HS, router._CLOUD_FUSED, text) == \
+        router._has_match(None, router._CLOUD_FUSED, text)
+
+
+@needs_hyperscan
+@pytest.mark.parametrize("text", CASES)
+def test_local_backends_agree(text):
+    assert router._has_match(router._LOCAL_HS, router._LOCAL_FUSED, text) == \
+        router._has_match(None, router._LOCAL_FUSED, text)
+
+
+@needs_hyperscan
+def test_concurrent_scans():
+    results = [None] * 4
+
+    def scan(i):
+        results[i] = [
+            router._has_match(router._CLOUD_HS, router._CLOUD_FUSED, text)
+            for text in CASES * 20
+        ]
+
+    threads = [threading.Thread(target=scan, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    expected = [router._has_match(None, router._CLOUD_FUSED, text) for text in CASES * 20]
+    assert results == [expected] * 4
+
+
+def test_classify():
+    assert classify("what time is it") == "local"
+    assert classify("Explain why the sky is blue") == "cloud"
+    assert classify("") == "local"
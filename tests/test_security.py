@@ -8,7 +8,11 @@ Run:
     python -m pytest tests/test_security.py -v
 """
 
+import gc
+import threading
 import time
+import weakref
+from collections import deque
 
 import pytest
 
@@ -18,7 +22,8 @@ from src.security.allowlist import (
     BLOCKED_ACTIONS,
     is_allowed,
 )
-from src.security.audit import AuditLogger, redact_secrets
+from src.security import audit
+from src.security.audit import AuditLogger, audit_log, redact_secrets
 from src.security.exceptions import AllowlistError, AuditError, RateLimitError, SecurityError
 from src.security.wrapper import ContainerController
 
@@ -63,6 +68,14 @@ class TestAllowlist:
     def test_is_allowed_bad_container(self):
         assert is_allowed("restart", "malicious") is False
 
+    def test_blocked_actions_never_allowed(self):
+        for action in BLOCKED_ACTIONS:
+            for container in ALLOWED_CONTAINERS:
+                assert is_allowed(action, container) is False
+
+    def test_blocked_and_allowed_disjoint(self):
+        assert not (ALLOWED_ACTIONS & BLOCKED_ACTIONS)
+
 
 # --- Exception Tests ---
 
@@ -80,6 +93,7 @@ class TestAudit:
     def test_log_creates_file(self, tmp_path):
         logger = AuditLogger(log_dir=tmp_path)
         logger.log("ATTEMPT", "test_action", "{'key': 'value'}")
+        logger.flush()  # Entries are written by a background thread
         assert (tmp_path / "audit.log").exists()
 
     def test_log_format(self, tmp_path):
@@ -116,10 +130,79 @@ class TestAudit:
         assert len(lines) == 5
         assert "op_19" in lines[-1]
 
+    def test_get_recent_spans_read_blocks(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        logger.TAIL_CHUNK = 64  # Force several backward reads
+        for i in range(50):
+            logger.log("ATTEMPT", f"op_{i}", "{}")
+        lines = logger.get_recent(20)
+        assert len(lines) == 20
+        assert "|op_30|" in lines[0]
+        assert "|op_49|" in lines[-1]
+
     def test_get_recent_empty(self, tmp_path):
         logger = AuditLogger(log_dir=tmp_path)
         assert logger.get_recent(5) == []
 
+    def test_close_and_reopen(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        logger.log("ATTEMPT", "first", "{}")
+        logger.flush()
+        logger.close()
+        logger.log("SUCCESS", "second", "{}")
+        logger.flush()
+        lines = (tmp_path / "audit.log").read_text().splitlines()
+        assert len(lines) == 2
+        assert "second" in lines[-1]
+
+    def test_write_failure_raises(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        (tmp_path / "audit.log").mkdir()  # Unwritable as a file
+        logger.log("ATTEMPT", "op", "{}")
+        with pytest.raises(AuditError):
+            logger.flush()
+
+    def test_unencodable_entry_keeps_writer(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        logger.log("ATTEMPT", "execute", '{"x":"\udc80"}')  # Lone surrogate
+        logger.log("SUCCESS", "execute", "{}")
+        lines = logger.get_recent(2)
+        assert len(lines) == 2
+        assert "\\udc80" in lines[0]
+
+    def test_dead_writer_raises(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        logger.log("ATTEMPT", "first", "{}")
+        logger.flush()
+        logger._queue.put(None)  # Stop the writer behind the logger's back
+        logger._writer.join()
+        with pytest.raises(AuditError, match="not running"):
+            logger.log("ATTEMPT", "second", "{}")
+        with pytest.raises(AuditError, match="not running"):
+            logger.flush()
+
+    def test_decorator_blocks_action_on_audit_failure(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        (tmp_path / "audit.log").mkdir()  # ATTEMPT can't be written
+        calls = []
+
+        @audit_log(logger)
+        def restart(container):
+            calls.append(container)
+
+        with pytest.raises(AuditError):
+            restart(container="n8n")
+        assert calls == []
+
+    def test_closed_logger_not_kept_alive(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+        logger.log("ATTEMPT", "op", "{}")
+        logger.close()
+        ref = weakref.ref(logger)
+        del logger
+        gc.collect()
+        assert ref() is None
+
 
 # --- Secret Redaction Tests ---
 
@@ -137,10 +220,74 @@ class TestRedaction:
         text = "{'password': 'super_secret_123'}"
         assert "super_secret_123" not in redact_secrets(text)
 
+    def test_redact_multiple_secrets(self):
+        text = "{'a': 'sk-ant-xyz', 'b': 'ok', 'Token': 'abc123'} " * 50
+        redacted = redact_secrets(text)
+        assert "sk-ant" not in redacted
+        assert "abc123" not in redacted
+        assert redacted.count("'ok'") == 50
+
     def test_no_redaction_needed(self):
         text = "{'action': 'restart', 'container': 'n8n'}"
         assert redact_secrets(text) == text
 
+    def test_decorator_redacts_before_truncating(self, tmp_path):
+        logger = AuditLogger(log_dir=tmp_path)
+
+        @audit_log(logger)
+        def restart(**kwargs):
+            return "ok"
+
+        # Long enough that the bounded repr's "..." lands inside the key
+        restart(x="x" * 92 + " sk-ant-api03-" + "A" * 95)
+        log_content = "\n".join(logger.get_recent(2))
+        assert "AAAA" not in log_content
+        assert "[REDACTED]" in log_content
+
+
+# Inputs covering every pattern, case variants, adjacent and overlapping
+# secrets, and non-ASCII text (str regex path vs Hyperscan UTF-8 + UCP)
+REDACTION_CASES = [
+    "key=sk-ant-api03-abc123XYZ",
+    "token=ptr_abc123",
+    "{'password': 'super_secret_123'}",
+    "{'a': 'sk-ant-xyz', 'b': 'ok', 'Token': 'abc123'} " * 3,
+    "PassWord = hunter2, next",
+    'SECRET:"x y"',
+    "token=\u00e9\u20aclongvalue}rest",
+    "sk-ant-ab ptr_cd token=ef",
+    "tokentoken=abc",
+    "password\u00e9=zz",
+    "token\u2003=\u2003val",
+    "no secrets here",
+]
+
+
+@pytest.mark.skipif(audit._hs_db is None, reason="hyperscan not installed")
+class TestRedactionBackends:
+    @pytest.mark.parametrize("text", REDACTION_CASES)
+    def test_hyperscan_matches_re(self, text):
+        expected = audit._SECRET_RE.sub("[REDACTED]", text)
+        assert audit._hyperscan_redact(text) == expected
+        if text.isascii():
+            ascii_path = audit._SECRET_RE_BYTES.sub(b"[REDACTED]", text.encode()).decode()
+            assert ascii_path == expected
+
+    def test_concurrent_scans(self):
+        text = REDACTION_CASES[3]
+        expected = audit._SECRET_RE.sub("[REDACTED]", text)
+        results = []
+
+        def scan():
+            results.extend(audit._hyperscan_redact(text) for _ in range(200))
+
+        threads = [threading.Thread(target=scan) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert results == [expected] * 800
+
 
 # --- Wrapper Tests ---
 
@@ -188,11 +335,63 @@ class TestContainerController:
         ctrl.execute("status", "n8n")
         ctrl.execute("status", "n8n")
         # Simulate time passing by clearing the window
-        ctrl._operation_times = [time.time() - 61, time.time() - 61]
+        ctrl._operation_times = deque([time.monotonic_ns() - 61_000_000_000] * 2, maxlen=2)
         # Should succeed now — old entries pruned
         result = ctrl.execute("status", "n8n")
         assert result["status"] == "ok"
 
+    def test_failed_operations_not_counted(self, tmp_path):
+        ctrl = ContainerController(dev_mode=True, rate_limit=1, audit_dir=tmp_path)
+
+        def fail(action, container, **kwargs):
+            raise RuntimeError("portainer unreachable")
+
+        ctrl._execute_portainer = fail
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                ctrl.execute("status", "n8n")
+        del ctrl._execute_portainer
+        result = ctrl.execute("status", "n8n")
+        assert result["status"] == "ok"
+
+    def test_rate_limit_counts_in_flight(self, tmp_path):
+        ctrl = ContainerController(dev_mode=True, rate_limit=3, audit_dir=tmp_path)
+        release = threading.Event()
+        real_execute = ctrl._execute_portainer
+
+        def slow(action, container, **kwargs):
+            release.wait(timeout=5)
+            return real_execute(action, container, **kwargs)
+
+        ctrl._execute_portainer = slow
+        outcomes = []
+
+        def call():
+            try:
+                ctrl.execute("status", "n8n")
+                outcomes.append("ok")
+            except RateLimitError:
+                outcomes.append("limited")
+
+        threads = [threading.Thread(target=call) for _ in range(10)]
+        for t in threads:
+            t.start()
+        time.sleep(0.2)  # All calls are either limited or blocked in slow()
+        release.set()
+        for t in threads:
+            t.join()
+        assert outcomes.count("ok") == 3
+        assert outcomes.count("limited") == 7
+
+    def test_audit_failure_blocks_execution(self, tmp_path):
+        ctrl = ContainerController(dev_mode=True, audit_dir=tmp_path)
+        (tmp_path / "audit.log").mkdir()  # Unwritable as a file
+        calls = []
+        ctrl._execute_portainer = lambda *args, **kwargs: calls.append(args)
+        with pytest.raises(AuditError):
+            ctrl.execute("restart", "n8n")
+        assert calls == []
+
     def test_audit_trail_on_success(self, tmp_path):
         ctrl = ContainerController(dev_mode=True, audit_dir=tmp_path)
         ctrl.execute("restart", "n8n")
@@ -214,6 +413,7 @@ class TestContainerController:
         ctrl = ContainerController(dev_mode=True, audit_dir=tmp_path)
         # Pass a secret-looking kwarg — should be redacted in logs
         ctrl.execute("status", "n8n", token="ptr_secret_token_123")
+        ctrl.audit.flush()
         log_content = (tmp_path / "audit.log").read_text()
         assert "ptr_secret_token_123" not in log_content
         assert "[REDACTED]" in log_content